@@ -0,0 +1,55 @@
+import importlib
+
+_modules = {
+    'common': ('space', 'msg', 'nope'),
+    'keys': ('key_base', 'key_up', 'key_down', 'key_left', 'key_right',
+             'key_home', 'key_end', 'key_insert', 'key_delete', 'key_page_up',
+             'key_page_down', 'escape_table', '_utf8_length', 'decode_keys'),
+    'session': ('InputSession', 'press_key'),
+    'macro': ('macro_magic', 'macro_version', 'record_key', 'record_sequence',
+              'record_name', 'record_callback', '_write_varint',
+              '_read_varint', 'MacroRecorder', 'read_macro', '_CallbackLog'),
+    'dispatch': ('Dispatcher',),
+    'snapshot': ('snapshot_magic', 'snapshot_version', 'dump_snapshot',
+                 'restore_snapshot', 'save_snapshot', 'load_snapshot'),
+    'tasks': ('run_coroutine', '_executor', 'BackgroundJob', 'background'),
+    'control': ('ControlModel', '_call', 'CounterModel'),
+    'keymap': ('Keymap', 'compile_keymap', 'option_keys', 'item_keys'),
+    'search': ('SearchIndex', 'FilterModel'),
+    'data': ('ObservableList', 'diff_entries', '_follow'),
+    'style': ('fColor', 'bgColor', '_decor', 'reset_code', 'Style',
+              'compile_style', 'compose_style', 'plain', 'Segment',
+              '_char_width', '_text_width', 'cell_width', 'wrap_cells',
+              'pad_cells', 'StyleModel'),
+    'option': ('Option',),
+    'item': ('Item',),
+    'caption': ('Caption',),
+    'label': ('Label',),
+    'render': ('Renderer', 'Region', 'RenderCache', 'DisplayModel',
+               'RenderScheduler'),
+    'virtual': ('control_pattern', 'VirtualScreen'),
+    'driver': ('AsyncDriver',),
+    'server': ('widget_state', 'restore_widget', '_SocketStream',
+               'MenuSession', 'MenuServer'),
+    'metrics': ('Histogram', 'Stats', 'stats', 'StatsOverlay'),
+    'submenu': ('SubmenuCache', 'Submenu'),
+    'loader': ('layout_version', 'widget_types', 'widget_keys', 'Menu',
+               'resolve', '_read_definition', 'validate_menu', 'parse_keymap',
+               '_cache_path', '_load_layout', '_save_layout', 'load_menu')}
+_exports = {name: module for module, names in _modules.items()
+            for name in names}
+__all__ = [name for name in _exports if not name.startswith('_')]
+
+
+def __getattr__(name: str):
+    module = _exports.get(name)
+    if module is None:
+        raise AttributeError('module {module!r} has no attribute {name!r}'
+                             .format(module=__name__, name=name))
+    value = getattr(importlib.import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_exports))
@@ -0,0 +1,12 @@
+import os
+import importlib
+
+_platform = None
+
+
+def platform():
+    global _platform
+    if _platform is None:
+        name = '.nt' if os.name == 'nt' else '.posix'
+        _platform = importlib.import_module(name, __name__)
+    return _platform
@@ -0,0 +1,50 @@
+import sys
+import time
+import msvcrt
+
+from .. import keys
+
+_stream = None
+
+
+def open_session(session):
+    pass
+
+
+def close_session(session):
+    pass
+
+
+def wake(session):
+    pass
+
+
+def read(session, block: bool, timeout: float = None) -> list:
+    events = list()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        if not msvcrt.kbhit():
+            if events or not block or session._woken:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            time.sleep(0.005)
+            continue
+        char = ord(msvcrt.getch())
+        if char == 0 or char == 224:
+            char = keys.key_base + ord(msvcrt.getch())
+        events.append(char)
+    return events
+
+
+def output():
+    global _stream
+    if _stream is None:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+        _stream = sys.stdout
+    return _stream
@@ -0,0 +1,84 @@
+import os
+import sys
+import tty
+import signal
+import select
+import termios
+
+from .. import keys
+
+
+def open_session(session):
+    if session._old_settings is not None:
+        return
+    if session.fd is None:
+        session.fd = sys.stdin.fileno()
+    session._wake_pipe = os.pipe()
+    os.set_blocking(session._wake_pipe[1], False)
+    session._old_settings = termios.tcgetattr(session.fd)
+    tty.setraw(session.fd)
+    for signum in (signal.SIGTERM, signal.SIGHUP):
+        try:
+            session._old_handlers[signum] = signal.signal(
+                signum, lambda signum, frame: _on_signal(session, signum))
+        except ValueError:
+            pass
+
+
+def close_session(session):
+    for signum, handler in session._old_handlers.items():
+        signal.signal(signum, handler)
+    session._old_handlers.clear()
+    if session._old_settings is not None:
+        termios.tcsetattr(session.fd, termios.TCSADRAIN,
+                          session._old_settings)
+        session._old_settings = None
+    if session._wake_pipe is not None:
+        for fd in session._wake_pipe:
+            os.close(fd)
+        session._wake_pipe = None
+
+
+def _on_signal(session, signum: int):
+    close_session(session)
+    os.kill(os.getpid(), signum)
+
+
+def wake(session):
+    if session._wake_pipe is not None:
+        try:
+            os.write(session._wake_pipe[1], b'\0')
+        except BlockingIOError:
+            pass
+
+
+def _ready(session, timeout: float = None) -> bool:
+    watch = [session.fd]
+    if session._wake_pipe is not None:
+        watch.append(session._wake_pipe[0])
+    readable, _, _ = select.select(watch, [], [], timeout)
+    if session._wake_pipe is not None and session._wake_pipe[0] in readable:
+        os.read(session._wake_pipe[0], 1024)
+        session._woken = False
+    return session.fd in readable
+
+
+def read(session, block: bool, timeout: float = None) -> list:
+    if not block:
+        timeout = 0
+    if not _ready(session, timeout):
+        return []
+    data = session._pending + os.read(session.fd, 1024)
+    events, session._pending = keys.decode_keys(data)
+    while session._pending and _ready(session, session.timeout):
+        data = session._pending + os.read(session.fd, 1024)
+        more, session._pending = keys.decode_keys(data)
+        events += more
+    if session._pending:
+        events += list(session._pending)
+        session._pending = b''
+    return events
+
+
+def output():
+    return sys.stdout
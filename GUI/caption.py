@@ -0,0 +1,69 @@
+from .common import space
+from .style import StyleModel, cell_width, pad_cells
+
+
+class Caption:
+    __slots__ = ('title', 'visibility', 'revision', '_render_key',
+                 '_render_cache', 'bookmark', 'display_mod', 'layout',
+                 'style_mod')
+
+    def __init__(self,
+                 title: str = '',
+                 bookmark: str = '',
+                 color: str = None,
+                 background: str = None) -> isinstance:
+        self.title = title
+        self.visibility = True
+        self.revision = 0
+        self._render_key = None
+        self._render_cache = ''
+        self.bookmark = bookmark
+        self.display_mod = None
+        self.layout = 'inline'
+        self.style_mod = StyleModel(color=color, background=background)
+
+    def set_style(self,
+                  color: str = None,
+                  background: str = None):
+        self.style_mod.set_up(color=color, background=background)
+        if self.display_mod is not None:
+            self.display_mod.relayout()
+
+    def hide(self):
+        self.visibility = False
+        self.invalidate()
+
+    def show(self):
+        self.visibility = True
+        self.invalidate()
+
+    def set_display_unit(self, unit: isinstance):
+        self.display_mod = unit
+        self.display_mod.add(self)
+        self.invalidate()
+        if self.style_mod.width is None:
+            self.style_mod.width = self.display_mod.width
+
+    def _standard_data(self) -> tuple:
+        caption = pad_cells(space + self.title.upper() + space,
+                            self.display_mod.width, 'center', '=')
+        subtitle = space * (self.display_mod.width - cell_width(
+            self.bookmark)) + self.style_mod.style.paint(self.bookmark.upper())
+        return caption, subtitle
+
+    def invalidate(self):
+        self.revision += 1
+        if self.display_mod is not None:
+            self.display_mod.mark_dirty(self)
+
+    @property
+    def display_data(self) -> tuple:
+        key = (self.visibility, self.style_mod.version,
+               self.display_mod.width, self.revision)
+        if key != self._render_key:
+            self._render_key = key
+            if self.visibility:
+                self._render_cache = self._standard_data()
+            else:
+                self._render_cache = ''
+        return self._render_cache
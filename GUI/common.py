@@ -0,0 +1,6 @@
+space = ' '
+msg = 'PAPERBOY:{labels} >'
+
+
+def nope():
+    pass
@@ -0,0 +1,115 @@
+import collections.abc
+
+from .dispatch import Dispatcher
+from .keymap import Keymap, compile_keymap, sequence_prefix
+from .tasks import BackgroundJob, run_coroutine
+
+
+class ControlModel:
+    __slots__ = ('observers', 'func_dict')
+
+    def __init__(self):
+        self.observers = []
+        self.func_dict = {0: {}}
+
+    def set_object(self, obj: Dispatcher):
+        self.observers.append(obj)
+
+    def load_func(self, index: int = 0,
+                  func: object = None,
+                  arg: tuple = None):
+        self.func_dict.setdefault(index, {func: arg})
+        self.func_dict[index].setdefault(func, arg)
+
+    def processor(self, value: tuple):
+        data_stream = list()
+        name, index = value
+        if index in self.func_dict.keys():
+            for func, arg in self.func_dict[index].items():
+                if 'next' == func:
+                    data_stream.append(('ctrl', (name, 'next')))
+                elif 'back' == func:
+                    data_stream.append(('ctrl', (name, 'back')))
+                else:
+                    data_stream.append(('func', (func, arg)))
+        return data_stream
+
+    def notify(self, value: tuple):
+        for observer in self.observers:
+            observer.update(value)
+
+    def update(self, value: tuple):
+        widget = value[0]
+        commands = self.processor(value)
+        for command in commands:
+            command_type, parameter = command
+            if command_type == 'ctrl':
+                self.notify(parameter)
+            elif command_type == 'func':
+                func_name, arg = parameter
+                for observer in self.observers:
+                    if observer.recorder is not None:
+                        observer.recorder.callback(func_name)
+                if isinstance(func_name, BackgroundJob):
+                    dispatcher = self.observers[0] if self.observers else None
+                    func_name.submit(widget, arg, dispatcher)
+                    continue
+                result = _call(func_name, arg)
+                if isinstance(result, collections.abc.Coroutine):
+                    run_coroutine(result)
+
+
+def _call(func: object, arg: tuple = None):
+    if arg is None:
+        return func()
+    return func(arg)
+
+
+class CounterModel:
+    __slots__ = ('data_out', 'max', 'keymap', 'pending', 'click_value')
+
+    def __init__(self, maximum: int, keymap: Keymap = None):
+        self.data_out = 0
+        self.max = maximum
+        self.keymap = keymap or compile_keymap()
+        self.pending = None
+        self.click_value = None
+
+    def _rebind(self, **bindings):
+        self.keymap = self.keymap.rebind(**bindings)
+        self.pending = None
+        Keymap.rebinds += 1
+
+    def increase_map(self,
+                     key_value: tuple = (100, 115)):
+        self._rebind(increase=key_value)
+
+    def decrease_map(self,
+                     key_value: tuple = (97, 119)):
+        self._rebind(decrease=key_value)
+
+    def click_map(self, key_value: tuple = (13, 101)):
+        self._rebind(click=key_value)
+
+    def get_key_table(self) -> frozenset:
+        return self.keymap.keys
+
+    def update(self, value: int) -> str:
+        if self.pending is None:
+            action = self.keymap.table.get(value)
+            if action is sequence_prefix:
+                action, self.pending = None, (value,)
+        else:
+            action, self.pending = self.keymap.follow(self.pending, value)
+        if action == 'increase':
+            self.data_out += 1
+            if self.data_out == self.max:
+                self.data_out = 0
+        elif action == 'decrease':
+            self.data_out -= 1
+            if self.data_out == -1:
+                self.data_out = self.max - 1
+        elif action in ('click', 'click_back'):
+            self.data_out += self.max
+            self.click_value = value
+        return action
@@ -0,0 +1,83 @@
+class ObservableList:
+
+    def __init__(self, items: tuple = ()):
+        self.items = list(items)
+        self.subscribers = list()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, index: int):
+        return self.items[index]
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def subscribe(self, callback: object):
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback: object):
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def _emit(self, op: str, index: int, value=None):
+        for callback in self.subscribers:
+            callback(op, index, value)
+
+    def insert(self, index: int, value):
+        index = min(index, len(self.items))
+        self.items.insert(index, value)
+        self._emit('insert', index, value)
+
+    def append(self, value):
+        self.insert(len(self.items), value)
+
+    def update(self, index: int, value):
+        self.items[index] = value
+        self._emit('update', index, value)
+
+    __setitem__ = update
+
+    def delete(self, index: int):
+        del self.items[index]
+        self._emit('delete', index)
+
+    __delitem__ = delete
+
+    def replace(self, items: tuple):
+        for op, index, value in diff_entries(self.items, items):
+            if op == 'insert':
+                self.items.insert(index, value)
+            elif op == 'delete':
+                del self.items[index]
+            else:
+                self.items[index] = value
+            self._emit(op, index, value)
+
+
+def diff_entries(old: list, new: list) -> list:
+    import difflib
+    changes = list()
+    matcher = difflib.SequenceMatcher(None, old, new, autojunk=False)
+    offset = 0
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            continue
+        common = min(i2 - i1, j2 - j1) if tag == 'replace' else 0
+        for n in range(common):
+            changes.append(('update', i1 + offset + n, new[j1 + n]))
+        for n in range(i2 - i1 - common):
+            changes.append(('delete', i1 + offset + common, None))
+        for n in range(j2 - j1 - common):
+            changes.append(('insert', i1 + offset + common + n,
+                            new[j1 + common + n]))
+        offset += (j2 - j1) - (i2 - i1)
+    return changes
+
+
+def _follow(position: int, op: str, index: int) -> int:
+    if op == 'insert' and index <= position:
+        return position + 1
+    elif op == 'delete' and index < position:
+        return position - 1
+    return position
@@ -0,0 +1,263 @@
+import time
+import collections
+
+from .keymap import Keymap
+from .macro import MacroRecorder, read_macro, _CallbackLog
+from .render import Renderer, RenderScheduler
+from .snapshot import dump_snapshot, restore_snapshot
+
+
+class Dispatcher:
+
+    def __init__(self):
+        self.observers = {0: []}
+        self._transfer_data = None
+        self.selected_channel = list()
+        self.single_mode = {0: False}
+        self.single_position = dict()
+        self.channel_of = dict()
+        self._routes = dict()
+        self._pending = dict()
+        self._rebinds = Keymap.rebinds
+        self.recorder = None
+        self.inbox = collections.deque()
+        self.waker = None
+        self.context = None
+        self.jobs = 0
+
+    @property
+    def data(self) -> int:
+        return self._transfer_data
+
+    @data.setter
+    def data(self, value: int):
+        self._transfer_data = value
+        if self.recorder is not None:
+            self.recorder.key(value)
+        self.notify()
+
+    def add(self, observer: isinstance, channel: int = 0):
+        observer.control_mod.set_object(self)
+        self.observers.setdefault(channel, [])
+        self.observers[channel].append(observer)
+        self.channel_of.setdefault(observer, channel)
+        self._routes.pop(channel, None)
+
+    def remove(self, observer: isinstance, channel: int = 0):
+        members = self.observers.get(channel, [])
+        if observer not in members:
+            return
+        index = members.index(observer)
+        members.remove(observer)
+        self._pending.pop(observer, None)
+        if channel in self.single_position:
+            position = self.single_position[channel]
+            if index < position or position >= len(members):
+                position -= 1
+            self.single_position[channel] = max(position, 0)
+        if self.channel_of.get(observer) == channel:
+            del self.channel_of[observer]
+            for key, value in self.observers.items():
+                if observer in value:
+                    self.channel_of[observer] = key
+                    break
+        self._routes.pop(channel, None)
+
+    def refresh(self, observer: isinstance):
+        for key, value in self.observers.items():
+            if observer in value:
+                self._routes.pop(key, None)
+
+    def set_single_channel(self, channel: int = 0):
+        if channel in self.observers.keys():
+            self.single_mode[channel] = True
+            self.single_position[channel] = 0
+        else:
+            pass
+
+    def select_channel(self, channel: int = 0):
+        self.selected_channel.append(channel)
+
+    def _switch(self, channel: int = None):
+        if self.single_mode.get(channel, False):
+            cur_position = self.single_position[channel]
+            if cur_position < len(self.observers[channel]) - 1:
+                self.single_position[channel] += 1
+            elif cur_position == len(self.observers[channel]) - 1:
+                self.single_position[channel] = 0
+
+    def _back(self, channel: int = None):
+        if self.single_mode.get(channel, False):
+            cur_position = self.single_position[channel]
+            if cur_position > 0:
+                self.single_position[channel] -= 1
+            elif cur_position == 0:
+                self.single_position[channel] = len(self.observers[channel]) - 1
+
+    def _search_group(self, name: isinstance):
+        return self.channel_of.get(name)
+
+    @staticmethod
+    def _interest(observer: isinstance):
+        if getattr(observer, 'filter_mod', None) is not None:
+            return None
+        counter = getattr(observer, 'counter', None)
+        if counter is None:
+            return None
+        return counter.get_key_table()
+
+    def _route(self, channel: int, key) -> dict:
+        if self._rebinds != Keymap.rebinds:
+            # CounterModel.*_map() swapped a keymap behind our back.
+            self._rebinds = Keymap.rebinds
+            self._routes.clear()
+        routes = self._routes.setdefault(channel, {})
+        try:
+            return routes[key]
+        except KeyError:
+            pass
+        members = list()
+        for observer in self.observers[channel]:
+            interest = self._interest(observer)
+            if interest is None or key in interest:
+                members.append(observer)
+        routes[key] = dict.fromkeys(members)
+        return routes[key]
+
+    def _deliver(self, member: isinstance, channel: int):
+        member.update(self.data)
+        counter = getattr(member, 'counter', None)
+        if counter is not None and counter.pending is not None:
+            self._pending[member] = channel
+        else:
+            self._pending.pop(member, None)
+
+    def notify(self):
+        for channel in self.selected_channel:
+            if channel not in self.observers:
+                continue
+            route = self._route(channel, self.data)
+            if self.single_mode.get(channel, False):
+                if not self.observers[channel]:
+                    continue
+                position = self.single_position[channel]
+                member = self.observers[channel][position]
+                if member in route or member in self._pending:
+                    self._deliver(member, channel)
+            else:
+                for member in route:
+                    self._deliver(member, channel)
+                if self._pending:
+                    # A key outside the table still has to cancel a
+                    # half-typed sequence.
+                    for member, on in list(self._pending.items()):
+                        if on == channel and member not in route:
+                            self._deliver(member, channel)
+
+    def _displays(self) -> list:
+        displays = list()
+        for members in self.observers.values():
+            for observer in members:
+                display = getattr(observer, 'display_mod', None)
+                if display is not None and display not in displays:
+                    displays.append(display)
+        return displays
+
+    def state(self) -> dict:
+        counters = dict()
+        for members in self.observers.values():
+            for observer in members:
+                counter = getattr(observer, 'counter', None)
+                if counter is not None:
+                    counters[observer] = counter.data_out
+        return {'data': self.data,
+                'single_position': dict(self.single_position),
+                'counters': counters}
+
+    def snapshot(self) -> bytes:
+        return dump_snapshot(self)
+
+    def restore(self, data: bytes):
+        restore_snapshot(self, data)
+
+    def feed(self, events, render: bool = True) -> dict:
+        displays = self._displays()
+        batch = RenderScheduler(max_fps=0)
+        schedulers = [display.scheduler for display in displays]
+        for display in displays:
+            display.scheduler = batch
+        try:
+            for key in events:
+                self.data = key
+        finally:
+            for display, scheduler in zip(displays, schedulers):
+                display.scheduler = scheduler
+        if render:
+            for display in batch.pending:
+                display.update()
+        return self.state()
+
+    def post(self, func: object, *args):
+        self.inbox.append((func, args))
+        if self.waker is not None:
+            self.waker()
+
+    def drain(self):
+        while self.inbox:
+            func, args = self.inbox.popleft()
+            func(*args)
+
+    def record(self, path: str):
+        self.stop_recording()
+        self.recorder = MacroRecorder(path)
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def replay(self, path: str, timing: bool = False,
+               headless: bool = False) -> dict:
+        displays = self._displays()
+        renderers = [display.renderer for display in displays]
+        if headless:
+            for display in displays:
+                from .virtual import VirtualScreen
+                display.set_renderer(Renderer(VirtualScreen()))
+        latency = list()
+        expected = list()
+        actual = list()
+        recorder = self.recorder
+        self.recorder = _CallbackLog(actual)
+        try:
+            for delay, kind, value in read_macro(path):
+                if timing and delay:
+                    time.sleep(delay)
+                if kind == 'callback':
+                    expected.append(value)
+                    continue
+                start = time.perf_counter()
+                self._transfer_data = value
+                self.notify()
+                for display in displays:
+                    if display.scheduler is not None:
+                        display.scheduler.flush(force=True)
+                latency.append(time.perf_counter() - start)
+        finally:
+            self.recorder = recorder
+            if headless:
+                for display, renderer in zip(displays, renderers):
+                    display.set_renderer(renderer)
+        return {'keys': len(latency),
+                'latency': latency,
+                'expected': expected,
+                'callbacks': actual}
+
+    def update(self, value: str):
+        name, command = value
+        if command == 'next':
+            on_channel = self._search_group(name)
+            self._switch(on_channel)
+        elif command == 'back':
+            on_channel = self._search_group(name)
+            self._back(on_channel)
@@ -0,0 +1,91 @@
+import os
+
+from .dispatch import Dispatcher
+from .render import DisplayModel, RenderScheduler
+from .session import InputSession
+from .tasks import run_coroutine
+
+
+class AsyncDriver:
+
+    def __init__(self, dispatcher: Dispatcher,
+                 display: DisplayModel,
+                 session: InputSession = None,
+                 poll_interval: float = 0.01,
+                 max_fps: float = 60):
+        self.dispatcher = dispatcher
+        self.display = display
+        self.session = session or InputSession()
+        self.poll_interval = poll_interval
+        self.loop = None
+        self.scheduler = RenderScheduler(max_fps)
+        self.scheduler.wake = self._arm
+        self._render_handle = None
+        self._stopped = None
+        display.scheduler = self.scheduler
+
+    def request(self, display: DisplayModel):
+        self.scheduler.request(display)
+
+    def _arm(self):
+        if self._render_handle is None and self.loop is not None:
+            self._render_handle = self.loop.call_later(self.scheduler.due(),
+                                                       self._flush)
+
+    def _flush(self):
+        self._render_handle = None
+        self.scheduler.flush()
+        if self.scheduler.pending:
+            self._arm()
+
+    def feed(self, events: list):
+        self.dispatcher.feed(events)
+
+    def _on_input(self):
+        self.feed(self.session.read(block=False))
+
+    def _poll_input(self):
+        self._on_input()
+        if not self._stopped.done():
+            self.loop.call_later(self.poll_interval, self._poll_input)
+
+    def set_interval(self, interval: float,
+                     func: object = None,
+                     arg: tuple = None):
+        import asyncio
+
+        def tick():
+            if arg is None:
+                result = func()
+            else:
+                result = func(arg)
+            if asyncio.iscoroutine(result):
+                run_coroutine(result)
+            self.request(self.display)
+            if not self._stopped.done():
+                self.loop.call_later(interval, tick)
+        return self.loop.call_later(interval, tick)
+
+    def stop(self):
+        if self._stopped is not None and not self._stopped.done():
+            self._stopped.set_result(None)
+
+    async def run(self):
+        import asyncio
+        self.loop = asyncio.get_running_loop()
+        self._stopped = self.loop.create_future()
+        self.dispatcher.waker = lambda: self.loop.call_soon_threadsafe(
+            self.dispatcher.drain)
+        with self.session:
+            if os.name == 'nt':
+                self.loop.call_soon(self._poll_input)
+            else:
+                self.loop.add_reader(self.session.fileno(), self._on_input)
+            self.request(self.display)
+            self._arm()
+            try:
+                await self._stopped
+            finally:
+                self.dispatcher.waker = None
+                if os.name != 'nt':
+                    self.loop.remove_reader(self.session.fileno())
@@ -0,0 +1,246 @@
+import bisect
+
+from .control import ControlModel, CounterModel
+from .keymap import Keymap, item_keys
+from .search import FilterModel
+from .data import ObservableList, diff_entries, _follow
+from .style import StyleModel, cell_width
+
+
+class Item:
+    __slots__ = ('item', 'visibility', 'revision', '_render_key',
+                 '_render_cache', 'counter', 'control_mod', 'filter_mod',
+                 'top', 'display_mod', 'style_mod', 'layout', 'data_out',
+                 'busy', '_source', '_auto_width')
+
+    def __init__(self, item: tuple,
+                 layout: str = 'inline',
+                 color: str = None,
+                 background: str = None,
+                 width: int = None,
+                 align: str = 'left',
+                 r_margin: int = 0,
+                 l_margin: int = 0,
+                 margin: int = 0,
+                 keymap: Keymap = None
+                 ):
+        self.item = tuple(str(n) for n in item)
+        self.visibility = True
+        self.revision = 0
+        self._render_key = None
+        self._render_cache = ''
+        self.counter = CounterModel(len(item), keymap or item_keys)
+        self.control_mod = ControlModel()
+        self.filter_mod = None
+        self.busy = 0
+        self._source = None
+        self._auto_width = False
+        self.top = 0
+        self.display_mod = None
+        self.style_mod = StyleModel(color=color,
+                                    background=background,
+                                    width=width,
+                                    align=align,
+                                    r_margin=r_margin,
+                                    l_margin=l_margin,
+                                    margin=margin)
+        self.layout = layout
+        self.data_out = ''
+
+    def _entry(self, position: int) -> int:
+        if self.filter_mod is None or self.filter_mod.view is None:
+            return position
+        return self.filter_mod.view[position]
+
+    def _standard_data(self) -> tuple:
+        data_list = tuple()
+        if self.filter_mod is not None and self.filter_mod.prompt is not None:
+            data_list = self.style_mod.brace(self.filter_mod.prompt)
+        if self.counter.max:
+            text = self.item[self._entry(self.counter.data_out)]
+        else:
+            text = ''
+        if self.busy:
+            text += ' ~'
+        data = self.style_mod.segment(text, reverse=True)
+        data_list += self.style_mod.brace(data)
+        return data_list
+
+    def invalidate(self):
+        self.revision += 1
+        if self.display_mod is not None:
+            self.display_mod.mark_dirty(self)
+
+    @property
+    def display_data(self) -> tuple:
+        key = (self.visibility, self.counter.data_out,
+               self.style_mod.version, self.revision)
+        if key != self._render_key:
+            self._render_key = key
+            if not self.visibility:
+                self._render_cache = ''
+            elif self.display_mod is not None and \
+                    self.display_mod.render_cache is not None:
+                shared = (self, key, bool(self.busy), self.counter.max,
+                          self.filter_mod and self.filter_mod.prompt)
+                self._render_cache = self.display_mod.render_cache.get(
+                    shared, self._standard_data)
+            else:
+                self._render_cache = self._standard_data()
+        return self._render_cache
+
+    def set_style(self,
+                  color: str = None,
+                  background: str = None,
+                  width: int = None,
+                  align: str = 'left',
+                  r_margin: int = 0,
+                  l_margin: int = 0,
+                  margin: int = 0):
+        self.style_mod.set_up(color=color,
+                              background=background,
+                              width=width,
+                              align=align,
+                              r_margin=r_margin,
+                              l_margin=l_margin,
+                              margin=margin)
+        if self.display_mod is not None:
+            self.display_mod.relayout()
+
+    def hide(self):
+        self.visibility = False
+        self.invalidate()
+
+    def show(self):
+        self.visibility = True
+        self.invalidate()
+
+    def set_func(self, index: int, func: object = None, arg: tuple = None):
+        self.control_mod.load_func(index, func, arg)
+
+    def set_display_unit(self, unit: isinstance):
+        self.display_mod = unit
+        self.display_mod.add(self)
+        self.invalidate()
+        if self.style_mod.width is None:
+            self._auto_width = True
+        if self._auto_width:
+            self._fit_width(self.item)
+
+    def _fit_width(self, entries):
+        width = max((cell_width(n) for n in entries), default=1)
+        width = min(max(width, self.style_mod.width or 1),
+                    self.display_mod.width)
+        if width != self.style_mod.width:
+            self.style_mod.width = width
+            self.style_mod.version += 1
+
+    def get_data(self, value: str):
+        self.data_out = value
+
+    def record_mode(self):
+        for n in range(len(self.item)):
+            self.control_mod.load_func(index=n,
+                                       func=self.record_mode,
+                                       arg=self.item[n])
+
+    def set_keymap(self, keymap: Keymap):
+        self.counter.keymap = keymap
+        self.counter.pending = None
+        for observer in self.control_mod.observers:
+            observer.refresh(self)
+
+    def filter_mode(self, start_key: int = 47):
+        self.filter_mod = FilterModel(self.item, start_key)
+        for observer in self.control_mod.observers:
+            observer.refresh(self)
+
+    def _apply_filter(self):
+        if self.filter_mod.view is None:
+            self.counter.max = len(self.item)
+        else:
+            self.counter.max = len(self.filter_mod.view)
+        self.counter.data_out = 0
+        self.top = 0
+        self.invalidate()
+
+    def bind(self, source):
+        if isinstance(self._source, ObservableList):
+            self._source.unsubscribe(self.apply)
+        if isinstance(source, ObservableList):
+            self._source = source
+            source.subscribe(self.apply)
+            self.item = [str(n) for n in source]
+            if self._auto_width and self.display_mod is not None:
+                self._fit_width(self.item)
+            self._follow_entry(0)
+        else:
+            self._source = iter(source)
+            self.poll()
+
+    def poll(self) -> bool:
+        try:
+            change = next(self._source)
+        except StopIteration:
+            return False
+        if isinstance(change, tuple) and change and \
+                change[0] in ('insert', 'delete', 'update'):
+            self.apply(*change)
+        else:
+            for op, index, value in diff_entries(list(self.item),
+                                                 [str(n) for n in change]):
+                self.apply(op, index, value, render=False)
+        if self.display_mod is not None:
+            self.display_mod.update()
+        return True
+
+    def apply(self, op: str, index: int, value=None, render=True):
+        if self.counter.max:
+            selected = self._entry(self.counter.data_out)
+        else:
+            selected = 0
+        if not isinstance(self.item, list):
+            self.item = list(self.item)
+        if op != 'delete' and self._auto_width and \
+                self.display_mod is not None:
+            self._fit_width((str(value),))
+        if op == 'insert':
+            self.item.insert(index, str(value))
+            if len(self.item) > 1:
+                selected = _follow(selected, op, index)
+        elif op == 'delete':
+            del self.item[index]
+            selected = _follow(selected, op, index)
+        else:
+            self.item[index] = str(value)
+        self._follow_entry(selected)
+        if render and self.display_mod is not None:
+            self.display_mod.update()
+
+    def _follow_entry(self, selected: int):
+        if self.filter_mod is not None:
+            self.filter_mod.reset(self.item)
+        if self.filter_mod is None or self.filter_mod.view is None:
+            self.counter.max = len(self.item)
+            position = selected
+        else:
+            self.counter.max = len(self.filter_mod.view)
+            position = bisect.bisect_left(self.filter_mod.view, selected)
+        self.counter.data_out = max(min(position, self.counter.max - 1), 0)
+        self.invalidate()
+
+    def update(self, value: int):
+        if self.filter_mod is not None and self.filter_mod.update(value):
+            self._apply_filter()
+            self.display_mod.update()
+            return
+        if self.counter.max == 0:
+            return
+        action = self.counter.update(value)
+        if self.counter.data_out >= self.counter.max:
+            self.counter.data_out -= self.counter.max
+            self.control_mod.update(
+                (self, 97 if action == 'click_back' else 100))
+        if action is not None:
+            self.display_mod.mark_dirty(self)
+            self.display_mod.update()
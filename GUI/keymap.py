@@ -0,0 +1,69 @@
+import functools
+
+actions = ('increase', 'decrease', 'click', 'click_back')
+sequence_prefix = 'prefix'
+
+
+class Keymap:
+    __slots__ = ('bindings', 'table', 'keys')
+    rebinds = 0
+
+    def __init__(self, increase: tuple = (), decrease: tuple = (),
+                 click: tuple = (), click_back: tuple = ()):
+        self.bindings = {'increase': tuple(increase),
+                         'decrease': tuple(decrease),
+                         'click': tuple(click),
+                         'click_back': tuple(click_back)}
+        table = dict()
+        sequences = list()
+        for action, keys in self.bindings.items():
+            for key in keys:
+                if isinstance(key, tuple) and len(key) > 1:
+                    sequences.append((key, action))
+                else:
+                    if isinstance(key, tuple):
+                        key = key[0]
+                    table.setdefault(key, action)
+        for sequence, action in sequences:
+            table.setdefault(sequence[0], sequence_prefix)
+            for n in range(2, len(sequence)):
+                table.setdefault(sequence[:n], sequence_prefix)
+            table.setdefault(sequence, action)
+        self.table = table
+        self.keys = frozenset(key for key in table
+                              if not isinstance(key, tuple)).union(
+            *(sequence for sequence, _ in sequences))
+
+    def follow(self, pending: tuple, key) -> tuple:
+        sequence = pending + (key,)
+        action = self.table.get(sequence)
+        if action is sequence_prefix:
+            return None, sequence
+        if action is not None:
+            return action, None
+        action = self.table.get(key)
+        if action is sequence_prefix:
+            return None, (key,)
+        return action, None
+
+    def rebind(self, **bindings) -> 'Keymap':
+        for action in bindings:
+            if action not in actions:
+                raise ValueError('unknown action {action!r}'.format(
+                    action=action))
+        merged = dict(self.bindings)
+        merged.update(bindings)
+        return compile_keymap(**{action: tuple(keys)
+                                 for action, keys in merged.items()})
+
+
+@functools.lru_cache(maxsize=None)
+def compile_keymap(increase: tuple = (), decrease: tuple = (),
+                   click: tuple = (), click_back: tuple = ()) -> Keymap:
+    return Keymap(increase, decrease, click, click_back)
+
+
+option_keys = compile_keymap(increase=(100, 115), decrease=(97, 119),
+                             click=(13, 101))
+item_keys = compile_keymap(increase=(119,), decrease=(115,),
+                           click=(100, 13, 101), click_back=(97,))
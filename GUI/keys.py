@@ -0,0 +1,60 @@
+key_base = 0x110000
+key_up = key_base + 72
+key_down = key_base + 80
+key_left = key_base + 75
+key_right = key_base + 77
+key_home = key_base + 71
+key_end = key_base + 79
+key_insert = key_base + 82
+key_delete = key_base + 83
+key_page_up = key_base + 73
+key_page_down = key_base + 81
+escape_table = {b'A': key_up, b'B': key_down,
+                b'C': key_right, b'D': key_left,
+                b'H': key_home, b'F': key_end,
+                b'1~': key_home, b'4~': key_end,
+                b'2~': key_insert, b'3~': key_delete,
+                b'5~': key_page_up, b'6~': key_page_down}
+
+
+def _utf8_length(lead: int) -> int:
+    if lead >= 0xf0:
+        return 4
+    elif lead >= 0xe0:
+        return 3
+    elif lead >= 0xc0:
+        return 2
+    return 1
+
+
+def decode_keys(data: bytes) -> tuple:
+    events = list()
+    index = 0
+    while index < len(data):
+        byte = data[index]
+        if byte == 0x1b:
+            if index + 1 == len(data):
+                break
+            if data[index + 1] != 0x5b:
+                events.append(byte)
+                index += 1
+                continue
+            end = index + 2
+            while end < len(data) and not 0x40 <= data[end] <= 0x7e:
+                end += 1
+            if end == len(data):
+                break
+            sequence = data[index + 2:end + 1]
+            events.append(escape_table.get(sequence, data[index:end + 1]))
+            index = end + 1
+        elif byte >= 0x80:
+            length = _utf8_length(byte)
+            if index + length > len(data):
+                break
+            char = data[index:index + length].decode('utf8', 'replace')
+            events.extend(ord(n) for n in char)
+            index += length
+        else:
+            events.append(byte)
+            index += 1
+    return events, data[index:]
@@ -0,0 +1,78 @@
+from .style import StyleModel
+
+
+class Label:
+    __slots__ = ('text', 'visibility', 'revision', '_render_key',
+                 '_render_cache', 'display_mod', 'layout', 'style_mod')
+
+    def __init__(self,
+                 text: str = '',
+                 color: str = None,
+                 background: str = None,
+                 width: int = None,
+                 r_margin: int = 0,
+                 l_margin: int = 0,
+                 margin: int = 0) -> isinstance:
+        self.text = text
+        self.visibility = True
+        self.revision = 0
+        self._render_key = None
+        self._render_cache = ''
+        self.display_mod = None
+        self.layout = 'inline'
+        self.style_mod = StyleModel(color=color,
+                                    background=background,
+                                    width=width,
+                                    r_margin=r_margin,
+                                    l_margin=l_margin,
+                                    margin=margin)
+
+    def set_style(self,
+                  color: str = None,
+                  background: str = None,
+                  width: int = None,
+                  r_margin: int = 0,
+                  l_margin: int = 0,
+                  margin: int = 0):
+        self.style_mod.set_up(color=color,
+                              background=background,
+                              width=width,
+                              r_margin=r_margin,
+                              l_margin=l_margin,
+                              margin=margin)
+        if self.display_mod is not None:
+            self.display_mod.relayout()
+
+    def hide(self):
+        self.visibility = False
+        self.invalidate()
+
+    def show(self):
+        self.visibility = True
+        self.invalidate()
+
+    def set_display_unit(self, unit: isinstance):
+        self.display_mod = unit
+        self.display_mod.add(self)
+        self.invalidate()
+        if self.style_mod.width is None:
+            self.style_mod.width = self.display_mod.width
+
+    def _standard_data(self) -> tuple:
+        return self.style_mod.brace(self.text)
+
+    def invalidate(self):
+        self.revision += 1
+        if self.display_mod is not None:
+            self.display_mod.mark_dirty(self)
+
+    @property
+    def display_data(self) -> tuple:
+        key = (self.visibility, self.style_mod.version, self.revision)
+        if key != self._render_key:
+            self._render_key = key
+            if self.visibility:
+                self._render_cache = self._standard_data()
+            else:
+                self._render_cache = ''
+        return self._render_cache
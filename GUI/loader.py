@@ -0,0 +1,283 @@
+import os
+import marshal
+import importlib
+
+from . import keys
+from .dispatch import Dispatcher
+from .keymap import Keymap, option_keys, item_keys
+from .render import DisplayModel
+from .style import fColor, bgColor
+from .option import Option
+from .item import Item
+from .caption import Caption
+from .label import Label
+
+
+layout_version = 1
+widget_types = {'Option': Option, 'Item': Item,
+                'Caption': Caption, 'Label': Label}
+widget_keys = ('name', 'type', 'funcs', 'channel', 'hidden', 'filter')
+control_keys = ('funcs', 'channel', 'filter', 'keymap')
+argument_choices = {'layout': ('inline', 'division'),
+                    'arrange': ('column', 'row'),
+                    'align': ('left', 'right', 'center'),
+                    'color': tuple(fColor),
+                    'background': tuple(bgColor)}
+positive_arguments = ('width', 'rows', 'sample')
+
+
+class Menu:
+
+    def __init__(self, dispatcher: Dispatcher, display: DisplayModel,
+                 widgets: dict):
+        self.dispatcher = dispatcher
+        self.display = display
+        self.widgets = widgets
+
+
+def resolve(path: str, names: dict = None) -> object:
+    head, _, tail = path.partition('.')
+    if names is not None and head in names:
+        target = names[head]
+        for attribute in tail.split('.') if tail else ():
+            target = getattr(target, attribute)
+        return target
+    parts = path.split('.')
+    for split in range(len(parts) - 1, 0, -1):
+        try:
+            target = importlib.import_module('.'.join(parts[:split]))
+        except ImportError:
+            continue
+        for attribute in parts[split:]:
+            target = getattr(target, attribute)
+        return target
+    raise ValueError('cannot resolve {path!r}'.format(path=path))
+
+
+def _read_definition(path: str) -> tuple:
+    import json
+    import hashlib
+    with open(path, 'rb') as file:
+        raw = file.read()
+    if path.endswith('.toml'):
+        import tomllib
+        definition = tomllib.loads(raw.decode('utf8'))
+    else:
+        definition = json.loads(raw.decode('utf8'))
+    return definition, hashlib.sha256(raw).hexdigest()
+
+
+def _check_argument(where: str, key: str, value, annotation: object):
+    if annotation is tuple:
+        if key == 'item':
+            kinds, expected = (str, int, float), 'a list of strings or numbers'
+        else:
+            kinds, expected = (str,), 'a list of strings'
+        valid = isinstance(value, list) and all(
+            isinstance(entry, kinds) and not isinstance(entry, bool)
+            for entry in value)
+    elif annotation is int:
+        least = 1 if key in positive_arguments else 0
+        valid = isinstance(value, int) and not isinstance(value, bool) and \
+            value >= least
+        expected = 'a positive integer' if least else \
+            'a non-negative integer'
+    elif annotation is str and key in argument_choices:
+        valid = value in argument_choices[key]
+        expected = 'one of ' + ', '.join(argument_choices[key])
+    elif annotation is str:
+        valid = isinstance(value, str)
+        expected = 'a string'
+    else:
+        return
+    if not valid:
+        raise ValueError('{where}: {key} must be {expected}'.format(
+            where=where, key=key, expected=expected))
+
+
+def validate_menu(definition: dict):
+    import inspect
+    if not isinstance(definition, dict):
+        raise ValueError('menu definition must be a table')
+    unknown = set(definition) - {'display', 'widgets', 'channels'}
+    if unknown:
+        raise ValueError('unknown sections: {keys}'.format(
+            keys=', '.join(sorted(unknown))))
+    display = definition.get('display', {})
+    if not isinstance(display, dict):
+        raise ValueError('display must be a table')
+    for key, value in display.items():
+        if key not in ('width', 'margin'):
+            raise ValueError('display: unknown key {key!r}'.format(key=key))
+        if not isinstance(value, int) or value < 0:
+            raise ValueError('display: {key} must be a non-negative '
+                             'integer'.format(key=key))
+    widgets = definition.get('widgets', [])
+    if not isinstance(widgets, list):
+        raise ValueError('widgets must be a list of tables')
+    names = set()
+    for number, widget in enumerate(widgets):
+        where = 'widgets[{n}]'.format(n=number)
+        if not isinstance(widget, dict):
+            raise ValueError('{where}: must be a table'.format(where=where))
+        kind = widget.get('type')
+        if kind not in widget_types:
+            raise ValueError('{where}: unknown type {kind!r}'.format(
+                where=where, kind=kind))
+        name = widget.get('name')
+        if not isinstance(name, str) or not name.isidentifier():
+            raise ValueError('{where}: name must be an identifier'.format(
+                where=where))
+        if name in names:
+            raise ValueError('{where}: duplicate name {name!r}'.format(
+                where=where, name=name))
+        names.add(name)
+        parameters = inspect.signature(widget_types[kind]).parameters
+        control = hasattr(widget_types[kind], 'control_mod')
+        for key in widget:
+            if key not in widget_keys and key not in parameters or \
+                    key in control_keys and not control:
+                raise ValueError('{where}: {kind} has no {key!r}'.format(
+                    where=where, kind=kind, key=key))
+        for key, parameter in parameters.items():
+            if key not in widget:
+                if parameter.default is inspect.Parameter.empty:
+                    raise ValueError('{where}: {kind} needs {key!r}'.format(
+                        where=where, kind=kind, key=key))
+            elif key != 'keymap' and not (widget[key] is None and
+                                          parameter.default is None):
+                _check_argument(where, key, widget[key],
+                                parameter.annotation)
+        funcs = widget.get('funcs', [])
+        if not isinstance(funcs, list):
+            raise ValueError('{where}: funcs must be a list'.format(
+                where=where))
+        for func in funcs:
+            if not isinstance(func, dict) or 'index' not in func or \
+                    not isinstance(func.get('func'), str):
+                raise ValueError('{where}: funcs entries need index and '
+                                 'func'.format(where=where))
+        if not isinstance(widget.get('channel', 0), int):
+            raise ValueError('{where}: channel must be an integer'.format(
+                where=where))
+        if 'keymap' in widget:
+            try:
+                parse_keymap(widget['keymap'], kind)
+            except (ValueError, TypeError) as error:
+                raise ValueError('{where}: {error}'.format(
+                    where=where, error=error)) from None
+    channels = definition.get('channels', {})
+    if not isinstance(channels, dict):
+        raise ValueError('channels must be a table')
+    for key, value in channels.items():
+        if key not in ('selected', 'single'):
+            raise ValueError('channels: unknown key {key!r}'.format(key=key))
+        if not isinstance(value, list) or \
+                not all(isinstance(channel, int) for channel in value):
+            raise ValueError('channels: {key} must be a list of '
+                             'integers'.format(key=key))
+
+
+def _key_code(key) -> object:
+    if isinstance(key, list):
+        return tuple(_key_code(n) for n in key)
+    if isinstance(key, str):
+        if len(key) == 1:
+            return ord(key)
+        if key == 'enter':
+            return 13
+        code = getattr(keys, 'key_' + key, None)
+        if code is None:
+            raise ValueError('unknown key {key!r}'.format(key=key))
+        return code
+    return key
+
+
+def parse_keymap(spec: dict, kind: str = 'Option') -> Keymap:
+    if not isinstance(spec, dict):
+        raise ValueError('keymap must be a table of action = [keys]')
+    base = item_keys if kind == 'Item' else option_keys
+    return base.rebind(**{action: tuple(_key_code(key) for key in bound)
+                          for action, bound in spec.items()})
+
+
+def _cache_path(path: str) -> str:
+    folder, name = os.path.split(os.path.abspath(path))
+    return os.path.join(folder, '__pycache__', name + '.layout')
+
+
+def _load_layout(path: str, digest: str):
+    try:
+        with open(_cache_path(path), 'rb') as file:
+            layout = marshal.load(file)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if layout.get('version') != layout_version or \
+            layout.get('hash') != digest:
+        return None
+    return layout
+
+
+def _save_layout(path: str, digest: str, display: DisplayModel):
+    units = display.display_unit
+    position = {id(unit): index for index, unit in enumerate(units)}
+    if display._groups is None:
+        display._groups = display._layout()
+    layout = {'version': layout_version,
+              'hash': digest,
+              'widths': [unit.style_mod.width for unit in units],
+              'groups': [(kind, [position[id(member)] for member in members])
+                         for kind, members in display._groups]}
+    try:
+        os.makedirs(os.path.dirname(_cache_path(path)), exist_ok=True)
+        with open(_cache_path(path), 'wb') as file:
+            marshal.dump(layout, file)
+    except OSError:
+        pass
+
+
+def load_menu(path: str, cache: bool = True) -> Menu:
+    definition, digest = _read_definition(path)
+    validate_menu(definition)
+    layout = _load_layout(path, digest) if cache else None
+    dispatcher = Dispatcher()
+    display = DisplayModel(**definition.get('display', {}))
+    widgets = dict()
+    for spec in definition.get('widgets', []):
+        kwargs = {key: value for key, value in spec.items()
+                  if key not in widget_keys}
+        for key in ('option', 'item'):
+            if key in kwargs:
+                kwargs[key] = tuple(kwargs[key])
+        if 'keymap' in kwargs:
+            kwargs['keymap'] = parse_keymap(kwargs['keymap'], spec['type'])
+        widgets[spec['name']] = widget_types[spec['type']](**kwargs)
+    for index, spec in enumerate(definition.get('widgets', [])):
+        widget = widgets[spec['name']]
+        for func in spec.get('funcs', []):
+            target = func['func']
+            if target not in ('next', 'back'):
+                target = resolve(target, widgets)
+            widget.set_func(index=func['index'], func=target,
+                            arg=func.get('arg'))
+        if spec.get('filter'):
+            widget.filter_mode()
+        if spec.get('hidden'):
+            widget.hide()
+        if layout is not None:
+            widget.style_mod.width = layout['widths'][index]
+        widget.set_display_unit(display)
+        if 'channel' in spec:
+            dispatcher.add(widget, channel=spec['channel'])
+    channels = definition.get('channels', {})
+    for channel in channels.get('selected', [0]):
+        dispatcher.select_channel(channel=channel)
+    for channel in channels.get('single', []):
+        dispatcher.set_single_channel(channel=channel)
+    if layout is not None:
+        units = display.display_unit
+        display._groups = [(kind, tuple(units[n] for n in members))
+                           for kind, members in layout['groups']]
+    elif cache:
+        _save_layout(path, digest, display)
+    return Menu(dispatcher, display, widgets)
@@ -0,0 +1,113 @@
+import time
+
+
+macro_magic = b'MNUR'
+macro_version = 2
+record_key = 1
+record_sequence = 2
+record_name = 3
+record_callback = 4
+
+
+def _write_varint(stream, value: int):
+    while True:
+        byte = value & 0x7f
+        value >>= 7
+        if value:
+            stream.write(bytes((byte | 0x80,)))
+        else:
+            stream.write(bytes((byte,)))
+            return
+
+
+def _read_varint(stream) -> int:
+    value = 0
+    shift = 0
+    while True:
+        byte = stream.read(1)
+        if not byte:
+            raise EOFError
+        value |= (byte[0] & 0x7f) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
+
+
+class MacroRecorder:
+
+    def __init__(self, path: str, clock: object = time.monotonic):
+        self.clock = clock
+        self.stream = open(path, 'wb')
+        self.stream.write(macro_magic + bytes((macro_version,)))
+        self.names = dict()
+        self.last = clock()
+
+    def _record(self, kind: int):
+        now = self.clock()
+        self.stream.write(bytes((kind,)))
+        _write_varint(self.stream, int((now - self.last) * 1e6))
+        self.last = now
+
+    def key(self, value):
+        if isinstance(value, int):
+            self._record(record_key)
+            _write_varint(self.stream, value)
+        else:
+            self._record(record_sequence)
+            _write_varint(self.stream, len(value))
+            self.stream.write(bytes(value))
+
+    def callback(self, func: object):
+        name = getattr(func, '__qualname__', None) or repr(func)
+        if name not in self.names:
+            self.names[name] = len(self.names)
+            encoded = name.encode('utf8')
+            self.stream.write(bytes((record_name,)))
+            _write_varint(self.stream, len(encoded))
+            self.stream.write(encoded)
+        self._record(record_callback)
+        _write_varint(self.stream, self.names[name])
+
+    def close(self):
+        self.stream.close()
+
+
+def read_macro(path: str) -> list:
+    records = list()
+    names = list()
+    with open(path, 'rb') as stream:
+        header = stream.read(len(macro_magic) + 1)
+        if header[:-1] != macro_magic or header[-1] != macro_version:
+            raise ValueError('not a macro file: {path}'.format(path=path))
+        while True:
+            kind = stream.read(1)
+            if not kind:
+                break
+            kind = kind[0]
+            if kind == record_name:
+                names.append(stream.read(_read_varint(stream)).decode('utf8'))
+                continue
+            delay = _read_varint(stream) / 1e6
+            if kind == record_key:
+                records.append((delay, 'key', _read_varint(stream)))
+            elif kind == record_sequence:
+                records.append((delay, 'key',
+                                stream.read(_read_varint(stream))))
+            elif kind == record_callback:
+                records.append((delay, 'callback',
+                                names[_read_varint(stream)]))
+            else:
+                raise ValueError('unknown record {kind}'.format(kind=kind))
+    return records
+
+
+class _CallbackLog:
+
+    def __init__(self, log: list):
+        self.log = log
+
+    def key(self, value):
+        pass
+
+    def callback(self, func: object):
+        self.log.append(getattr(func, '__qualname__', None) or repr(func))
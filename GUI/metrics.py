@@ -0,0 +1,190 @@
+import time
+import functools
+
+from . import keys, control
+from .dispatch import Dispatcher
+from .control import ControlModel
+from .render import DisplayModel, Renderer
+from .style import StyleModel
+from .option import Option
+from .item import Item
+from .caption import Caption
+from .label import Label
+
+
+class Histogram:
+    __slots__ = ('count', 'total', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.buckets = [0] * 260
+
+    def add(self, elapsed: int):
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        if elapsed < 4:
+            self.buckets[elapsed] += 1
+        else:
+            bits = elapsed.bit_length()
+            self.buckets[bits * 4 + (elapsed >> (bits - 3) & 3)] += 1
+
+    @staticmethod
+    def _bound(index: int) -> int:
+        if index < 4:
+            return index
+        bits, sub = divmod(index, 4)
+        return (5 + sub << bits - 3) - 1
+
+    def percentile(self, fraction: float) -> int:
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= target:
+                return min(self._bound(index), self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        return {'count': self.count,
+                'total_ms': self.total / 1e6,
+                'mean_us': self.total / self.count / 1e3 if self.count else 0,
+                'p50_us': self.percentile(0.5) / 1e3,
+                'p99_us': self.percentile(0.99) / 1e3,
+                'max_us': self.max / 1e3}
+
+
+class Stats:
+    targets = ((Dispatcher, 'notify', 'notify'),
+               (ControlModel, 'update', 'control'),
+               (DisplayModel, '_assemble', 'assemble'),
+               (Renderer, 'write', 'write'))
+    widgets = (Option, Item, Caption, Label)
+
+    def __init__(self):
+        self.enabled = False
+        self.histograms = dict()
+        self._originals = list()
+
+    def record(self, name: str, elapsed: int):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.add(elapsed)
+
+    def _timed(self, name: str, func: object) -> object:
+        clock = time.perf_counter_ns
+        record = self.record
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, clock() - start)
+        return timed
+
+    def _timed_call(self, func: object) -> object:
+        clock = time.perf_counter_ns
+        record = self.record
+
+        def timed(callback: object, arg: tuple = None):
+            start = clock()
+            try:
+                return func(callback, arg)
+            finally:
+                name = getattr(callback, '__qualname__', None) or \
+                    type(callback).__name__
+                record('callback.' + name, clock() - start)
+        return timed
+
+    def _patch(self, owner: object, name: str, func: object):
+        self._originals.append((owner, name, owner.__dict__[name]))
+        setattr(owner, name, func)
+
+    def enable(self):
+        if self.enabled:
+            return
+        self._patch(keys, 'decode_keys',
+                    self._timed('decode', keys.decode_keys))
+        self._patch(control, '_call', self._timed_call(control._call))
+        for owner, name, label in self.targets:
+            self._patch(owner, name,
+                        self._timed(label, owner.__dict__[name]))
+        for widget in self.widgets:
+            getter = widget.__dict__['display_data'].fget
+            self._patch(widget, 'display_data', property(self._timed(
+                'display_data.' + widget.__name__, getter)))
+        self.enabled = True
+
+    def disable(self):
+        for owner, name, func in reversed(self._originals):
+            setattr(owner, name, func)
+        self._originals = list()
+        self.enabled = False
+
+    def reset(self):
+        self.histograms = dict()
+
+    def report(self) -> dict:
+        return {name: histogram.summary()
+                for name, histogram in self.histograms.items()}
+
+    def line(self) -> str:
+        ordered = sorted(self.histograms.items(),
+                         key=lambda item: item[1].total, reverse=True)
+        return ' '.join('{name} {p50:.0f}/{p99:.0f}us'.format(
+            name=name,
+            p50=histogram.percentile(0.5) / 1e3,
+            p99=histogram.percentile(0.99) / 1e3)
+            for name, histogram in ordered)
+
+
+stats = Stats()
+
+
+class StatsOverlay:
+    __slots__ = ('stats', 'visibility', 'revision', 'display_mod', 'layout',
+                 'style_mod')
+
+    def __init__(self,
+                 source: Stats = None,
+                 color: str = None,
+                 background: str = None) -> isinstance:
+        self.stats = source or stats
+        self.visibility = True
+        self.revision = 0
+        self.display_mod = None
+        self.layout = 'inline'
+        self.style_mod = StyleModel(color=color, background=background)
+
+    def invalidate(self):
+        self.revision += 1
+        if self.display_mod is not None:
+            self.display_mod.mark_dirty(self)
+
+    @property
+    def display_data(self) -> tuple:
+        if not self.visibility:
+            return ''
+        return self.style_mod.brace(
+            self.stats.line()[:self.style_mod.width])
+
+    def hide(self):
+        self.visibility = False
+        self.invalidate()
+
+    def show(self):
+        self.visibility = True
+        self.invalidate()
+
+    def set_display_unit(self, unit: isinstance):
+        self.display_mod = unit
+        self.display_mod.add(self)
+        self.display_mod.overlay = self
+        if self.style_mod.width is None:
+            self.style_mod.width = self.display_mod.width
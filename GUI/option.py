@@ -0,0 +1,308 @@
+import bisect
+import itertools
+
+from .control import ControlModel, CounterModel
+from .keymap import Keymap, option_keys
+from .search import FilterModel
+from .data import ObservableList, diff_entries, _follow
+from .style import StyleModel, cell_width
+
+
+class Option:
+    __slots__ = ('option', 'rows', 'sample', 'top', 'visibility', 'revision',
+                 '_render_key', '_render_cache', 'counter', 'control_mod',
+                 'filter_mod', 'display_mod', 'style_mod', 'layout',
+                 'arrange', 'busy', '_source', '_lines', '_lines_key',
+                 '_auto_width')
+
+    def __init__(self, option: tuple,
+                 arrange: str = 'column',
+                 layout: str = 'inline',
+                 color: str = None,
+                 background: str = None,
+                 width: int = None,
+                 align: str = 'left',
+                 r_margin: int = 0,
+                 l_margin: int = 0,
+                 margin: int = 0,
+                 rows: int = None,
+                 sample: int = 256,
+                 keymap: Keymap = None,
+                 ):
+        self.option = option
+        self.rows = rows
+        self.sample = sample
+        self.top = 0
+        self.visibility = True
+        self.revision = 0
+        self._render_key = None
+        self._render_cache = ''
+        self.counter = CounterModel(len(option), keymap or option_keys)
+        self.control_mod = ControlModel()
+        self.filter_mod = None
+        self.busy = 0
+        self._source = None
+        self._auto_width = False
+        self._lines = None
+        self._lines_key = None
+        self.display_mod = None
+        self.style_mod = StyleModel(color=color,
+                                    background=background,
+                                    width=width,
+                                    align=align,
+                                    r_margin=r_margin,
+                                    l_margin=l_margin,
+                                    margin=margin)
+        self.layout = layout
+        self.arrange = arrange
+
+    def _entry(self, position: int) -> int:
+        if self.filter_mod is None or self.filter_mod.view is None:
+            return position
+        return self.filter_mod.view[position]
+
+    def _window(self) -> range:
+        total = self.counter.max
+        if self.rows is None or self.rows >= total:
+            return range(total)
+        position = self.counter.data_out
+        if position < self.top:
+            self.top = position
+        elif position >= self.top + self.rows:
+            self.top = position - self.rows + 1
+        self.top = min(self.top, total - self.rows)
+        return range(self.top, self.top + self.rows)
+
+    def _scroll_marks(self, window: range) -> tuple:
+        if self.rows is None or len(window) == self.counter.max:
+            return None, None
+        if self.arrange == 'row':
+            more_before, more_after = '<', '>'
+        else:
+            more_before, more_after = '  ^', '  v'
+        head = more_before if window.start > 0 else ''
+        tail = more_after if window.stop < self.counter.max else ''
+        return head, tail
+
+    def _entry_lines(self, entry: int) -> tuple:
+        key = (self.style_mod.version, self.style_mod.width)
+        if self._lines_key != key or self._lines is None:
+            self._lines = [None] * len(self.option)
+            self._lines_key = key
+        lines = self._lines[entry]
+        if lines is None:
+            lines = self.style_mod.brace('  ' + self.option[entry].title())
+            self._lines[entry] = lines
+        return lines
+
+    def _standard_data(self) -> tuple:
+        blocks = list()
+        window = self._window()
+        head, tail = self._scroll_marks(window)
+        for idx in window:
+            if idx == self.counter.data_out:
+                mark = '~' if self.busy else '*'
+                opt_line = mark + ' ' + self.option[self._entry(idx)].title()
+                blocks.append(self.style_mod.brace(
+                    self.style_mod.segment(opt_line, reverse=True)))
+            else:
+                blocks.append(self._entry_lines(self._entry(idx)))
+        if head is not None:
+            blocks.insert(0, self.style_mod.brace(head))
+            blocks.append(self.style_mod.brace(tail))
+        if self.filter_mod is not None and self.filter_mod.prompt is not None:
+            blocks.insert(0, self.style_mod.brace(self.filter_mod.prompt))
+        data_list = list()
+        if self.arrange == 'row':
+            data_strip = itertools.zip_longest(*blocks, fillvalue='')
+            for line in data_strip:
+                data_list.append(''.join(line))
+        elif self.arrange == 'column':
+            for block in blocks:
+                data_list += block
+        else:
+            pass
+        return tuple(data_list)
+
+    def invalidate(self):
+        self.revision += 1
+        if self.display_mod is not None:
+            self.display_mod.mark_dirty(self)
+
+    @property
+    def display_data(self) -> tuple:
+        key = (self.visibility, self.counter.data_out,
+               self.style_mod.version, self.revision)
+        if key != self._render_key:
+            self._render_key = key
+            if not self.visibility:
+                self._render_cache = ''
+            elif self.display_mod is not None and \
+                    self.display_mod.render_cache is not None:
+                shared = (self, key, self.top, bool(self.busy),
+                          self.counter.max,
+                          self.filter_mod and self.filter_mod.prompt)
+                self._render_cache, self.top = \
+                    self.display_mod.render_cache.get(
+                        shared, lambda: (self._standard_data(), self.top))
+            else:
+                self._render_cache = self._standard_data()
+        return self._render_cache
+
+    def set_style(self,
+                  color: str = None,
+                  background: str = None,
+                  width: int = None,
+                  align: str = 'left',
+                  r_margin: int = 0,
+                  l_margin: int = 0,
+                  margin: int = 0):
+        self.style_mod.set_up(color=color,
+                              background=background,
+                              width=width,
+                              align=align,
+                              r_margin=r_margin,
+                              l_margin=l_margin,
+                              margin=margin)
+        if self.display_mod is not None:
+            self.display_mod.relayout()
+
+    def hide(self):
+        self.visibility = False
+        self.invalidate()
+
+    def show(self):
+        self.visibility = True
+        self.invalidate()
+
+    def set_func(self, index: int, func: object = None, arg: tuple = None):
+        self.control_mod.load_func(index, func, arg)
+
+    def set_display_unit(self, unit: isinstance):
+        self.display_mod = unit
+        self.display_mod.add(self)
+        self.invalidate()
+        if self.style_mod.width is None:
+            self._auto_width = True
+        if self._auto_width:
+            if self.rows is None:
+                sample = self.option
+            else:
+                sample = itertools.islice(self.option, self.sample)
+            self._fit_width(sample)
+
+    def _fit_width(self, entries):
+        width = max((cell_width(n) for n in entries), default=1)
+        width = min(max(width, self.style_mod.width or 1),
+                    self.display_mod.width)
+        if width != self.style_mod.width:
+            self.style_mod.width = width
+            self.style_mod.version += 1
+
+    def set_keymap(self, keymap: Keymap):
+        self.counter.keymap = keymap
+        self.counter.pending = None
+        for observer in self.control_mod.observers:
+            observer.refresh(self)
+
+    def filter_mode(self, start_key: int = 47):
+        self.filter_mod = FilterModel(self.option, start_key)
+        for observer in self.control_mod.observers:
+            observer.refresh(self)
+
+    def _apply_filter(self):
+        if self.filter_mod.view is None:
+            self.counter.max = len(self.option)
+        else:
+            self.counter.max = len(self.filter_mod.view)
+        self.counter.data_out = 0
+        self.top = 0
+        self.invalidate()
+
+    def bind(self, source):
+        if isinstance(self._source, ObservableList):
+            self._source.unsubscribe(self.apply)
+        if isinstance(source, ObservableList):
+            self._source = source
+            source.subscribe(self.apply)
+            self.option = list(source)
+            self._lines = None
+            if self._auto_width and self.display_mod is not None:
+                self._fit_width(itertools.islice(self.option, self.sample))
+            self._follow_entry(0)
+        else:
+            self._source = iter(source)
+            self.poll()
+
+    def poll(self) -> bool:
+        try:
+            change = next(self._source)
+        except StopIteration:
+            return False
+        if isinstance(change, tuple) and change and \
+                change[0] in ('insert', 'delete', 'update'):
+            self.apply(*change)
+        else:
+            for op, index, value in diff_entries(list(self.option),
+                                                 list(change)):
+                self.apply(op, index, value, render=False)
+        if self.display_mod is not None:
+            self.display_mod.update()
+        return True
+
+    def apply(self, op: str, index: int, value=None, render=True):
+        if self.counter.max:
+            selected = self._entry(self.counter.data_out)
+        else:
+            selected = 0
+        if not isinstance(self.option, list):
+            self.option = list(self.option)
+        if op != 'delete' and self._auto_width and \
+                self.display_mod is not None:
+            self._fit_width((value,))
+        if op == 'insert':
+            self.option.insert(index, value)
+            if self._lines is not None:
+                self._lines.insert(index, None)
+            if len(self.option) > 1:
+                selected = _follow(selected, op, index)
+        elif op == 'delete':
+            del self.option[index]
+            if self._lines is not None:
+                del self._lines[index]
+            selected = _follow(selected, op, index)
+        else:
+            self.option[index] = value
+            if self._lines is not None:
+                self._lines[index] = None
+        self._follow_entry(selected)
+        if render and self.display_mod is not None:
+            self.display_mod.update()
+
+    def _follow_entry(self, selected: int):
+        if self.filter_mod is not None:
+            self.filter_mod.reset(self.option)
+        if self.filter_mod is None or self.filter_mod.view is None:
+            self.counter.max = len(self.option)
+            position = selected
+        else:
+            self.counter.max = len(self.filter_mod.view)
+            position = bisect.bisect_left(self.filter_mod.view, selected)
+        self.counter.data_out = max(min(position, self.counter.max - 1), 0)
+        self.invalidate()
+
+    def update(self, value: int):
+        if self.filter_mod is not None and self.filter_mod.update(value):
+            self._apply_filter()
+            self.display_mod.update()
+            return
+        if self.counter.max == 0:
+            return
+        action = self.counter.update(value)
+        if self.counter.data_out >= self.counter.max:
+            self.counter.data_out -= self.counter.max
+            self.control_mod.update((self,
+                                     self._entry(self.counter.data_out)))
+        if action is not None:
+            self.display_mod.mark_dirty(self)
+            self.display_mod.update()
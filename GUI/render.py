@@ -0,0 +1,298 @@
+import time
+import itertools
+import collections
+
+from .common import space
+from .style import painted_width
+from .backends import platform
+
+
+class Renderer:
+
+    def __init__(self, stream=None):
+        self.stream = stream
+        self.frame = []
+        self.cursor_hidden = False
+
+    def reset(self):
+        self.frame = []
+
+    def _diff(self, lines: list) -> list:
+        data_stream = list()
+        if not self.cursor_hidden:
+            data_stream.append('\033[?25l\033[2J')
+            self.cursor_hidden = True
+        for row, line in enumerate(lines):
+            if row < len(self.frame) and self.frame[row] == line:
+                continue
+            data_stream.append('\033[{row};1H'.format(row=row + 1) +
+                               line + '\033[K')
+        if len(lines) < len(self.frame):
+            data_stream.append('\033[{row};1H\033[J'.format(
+                row=len(lines) + 1))
+        return data_stream
+
+    def write(self, data_stream: list):
+        if data_stream:
+            stream = self.stream or platform().output()
+            stream.write(''.join(data_stream))
+            stream.flush()
+
+    def draw(self, data: str):
+        lines = data.split('\n')
+        data_stream = self._diff(lines)
+        self.frame = lines
+        self.write(data_stream)
+
+    def patch(self, row: int, lines: list) -> list:
+        changed = list()
+        for offset, line in enumerate(lines):
+            if self.frame[row + offset] != line:
+                self.frame[row + offset] = line
+                changed.append(row + offset)
+        return changed
+
+
+class Region:
+    __slots__ = ('group', 'position', 'row', 'height', 'column', 'width')
+
+    def __init__(self, group: int, position: int, row: int, height: int,
+                 column: int, width: int):
+        self.group = group
+        self.position = position
+        self.row = row
+        self.height = height
+        self.column = column
+        self.width = width
+
+
+class RenderCache:
+
+    def __init__(self, limit: int = 4096):
+        self.limit = limit
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple, build: object):
+        data = self.entries.get(key)
+        if data is None:
+            self.misses += 1
+            data = build()
+            self.entries[key] = data
+            while len(self.entries) > self.limit:
+                self.entries.popitem(last=False)
+        else:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        return data
+
+    def clear(self):
+        self.entries.clear()
+
+
+class DisplayModel:
+
+    def __init__(self,
+                 width: int = 76,
+                 margin: int = 2,
+                 backend=None,
+                 ):
+        self.display_unit = []
+        self.margin = margin
+        self.width = width
+        self.renderer = Renderer(backend)
+        self.scheduler = None
+        self.render_cache = None
+        self.overlay = None
+        self.watcher = None
+        self._groups = None
+        self._rows = dict()
+        self.regions = None
+        self._dirty = dict()
+
+    def add(self, unit: object):
+        self.display_unit.append(unit)
+        self.relayout()
+        if self.watcher is not None:
+            self.watcher.unit_added(unit)
+
+    def remove(self, unit: object):
+        self.display_unit.remove(unit)
+        if unit is self.overlay:
+            self.overlay = None
+        self.relayout()
+        if self.watcher is not None:
+            self.watcher.unit_removed(unit)
+
+    def relayout(self):
+        self._groups = None
+        self._rows = dict()
+        self.regions = None
+
+    def set_renderer(self, renderer: Renderer):
+        self.renderer = renderer
+        self.regions = None
+
+    def mark_dirty(self, unit: object):
+        self._dirty[unit] = None
+
+    def init_scene(self, func=None):
+        if func is None:
+            self.update()
+        else:
+            func()
+
+    def _layout(self) -> list:
+        groups = list()
+        consumed = set()
+        for index, unit in enumerate(self.display_unit):
+            if unit.layout == 'inline':
+                groups.append(('inline', (unit,)))
+            elif unit.layout == 'division' and id(unit) not in consumed:
+                members = [unit]
+                division_total_width = unit.style_mod.width
+                for remain in self.display_unit[index + 1:]:
+                    division_total_width += remain.style_mod.width
+                    if remain.layout == 'inline' or \
+                            division_total_width > self.width:
+                        break
+                    else:
+                        members.append(remain)
+                consumed.update(id(member) for member in members)
+                groups.append(('division', tuple(members)))
+        return groups
+
+    def _group_rows(self, index: int, layout: str, members: tuple) -> str:
+        data = tuple(member.display_data for member in members)
+        cached = self._rows.get(index)
+        if cached is not None and all(
+                old is new for old, new in zip(cached[0], data)):
+            return cached[1]
+        if layout == 'inline':
+            lines = data[0]
+        else:
+            lines = (''.join(line) for line in
+                     itertools.zip_longest(*data, fillvalue=''))
+        margin = self.margin * space
+        rows = ''.join([margin + line + margin + '\n' for line in lines])
+        self._rows[index] = (data, rows)
+        return rows
+
+    def _assemble(self) -> str:
+        if self._groups is None:
+            self._groups = self._layout()
+        return ''.join([self._group_rows(index, layout, members)
+                        for index, (layout, members)
+                        in enumerate(self._groups)])
+
+    @staticmethod
+    def _unit_width(data: tuple) -> int:
+        widths = set(painted_width(line) for line in data)
+        if len(widths) > 1:
+            return None
+        return widths.pop() if widths else 0
+
+    def _place(self) -> dict:
+        regions = dict()
+        row = 0
+        for index, (layout, members) in enumerate(self._groups):
+            data = self._rows[index][0]
+            height = max([len(n) for n in data] + [0])
+            column = self.margin
+            for position, member in enumerate(members):
+                width = self._unit_width(data[position])
+                regions[member] = Region(index, position, row, height,
+                                         column, width)
+                if column is not None and width is not None:
+                    column += width
+                else:
+                    column = None
+            row += height
+        return regions
+
+    def _render_dirty(self) -> bool:
+        groups = dict()
+        for unit in self._dirty:
+            region = self.regions.get(unit)
+            if region is None:
+                return False
+            groups.setdefault(region.group, []).append(region)
+        updates = list()
+        for index, regions in groups.items():
+            layout, members = self._groups[index]
+            old_data = self._rows[index][0]
+            rows = self._group_rows(index, layout, members)
+            data = self._rows[index][0]
+            if [len(n) for n in data] != [len(n) for n in old_data]:
+                return False
+            updates.append((regions, rows.split('\n')[:-1], old_data, data))
+        data_stream = list()
+        for regions, lines, old_data, data in updates:
+            height = regions[0].height
+            changed = self.renderer.patch(regions[0].row, lines)
+            if len(data) > 1 and all(len(n) in (0, height) for n in data) \
+                    and all(region.column is not None and
+                            region.width is not None for region in regions):
+                for region in regions:
+                    old_lines = old_data[region.position]
+                    for offset, line in enumerate(data[region.position]):
+                        if line != old_lines[offset]:
+                            data_stream.append(
+                                '\033[{row};{column}H'.format(
+                                    row=region.row + offset + 1,
+                                    column=region.column + 1) + line)
+            else:
+                for row in changed:
+                    data_stream.append('\033[{row};1H'.format(row=row + 1) +
+                                       self.renderer.frame[row] + '\033[K')
+        self.renderer.write(data_stream)
+        return True
+
+    def render(self):
+        if self.overlay is not None:
+            self._dirty[self.overlay] = None
+        if self._dirty and self.regions is not None and \
+                self.renderer.frame and self._render_dirty():
+            self._dirty.clear()
+            return
+        self._dirty.clear()
+        self.renderer.draw(self._assemble())
+        self.regions = self._place()
+
+    def update(self):
+        if self.scheduler is None:
+            self.render()
+        else:
+            self.scheduler.request(self)
+
+
+class RenderScheduler:
+
+    def __init__(self, max_fps: float = 60, clock: object = time.monotonic):
+        self.interval = 1 / max_fps if max_fps else 0
+        self.clock = clock
+        self.pending = list()
+        self.last_frame = None
+        self.wake = None
+
+    def request(self, display: DisplayModel):
+        if display not in self.pending:
+            self.pending.append(display)
+            if len(self.pending) == 1 and self.wake is not None:
+                self.wake()
+
+    def due(self) -> float:
+        if self.last_frame is None:
+            return 0
+        return max(self.last_frame + self.interval - self.clock(), 0)
+
+    def flush(self, force: bool = False) -> bool:
+        if not self.pending or (not force and self.due() > 0):
+            return False
+        pending = self.pending
+        self.pending = list()
+        self.last_frame = self.clock()
+        for display in pending:
+            display.render()
+        return True
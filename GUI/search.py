@@ -0,0 +1,127 @@
+from . import keys
+from .tasks import _executor
+
+index_threshold = 4096
+
+
+class SearchIndex:
+
+    def __init__(self, entries: tuple, gram: int = 3):
+        self.gram = gram
+        self.keys = tuple(str(n).lower() for n in entries)
+        self.grams = dict()
+        for idx, key in enumerate(self.keys):
+            grams = set(key)
+            grams.update(key[n:n + gram] for n in range(len(key) - gram + 1))
+            for part in grams:
+                self.grams.setdefault(part, []).append(idx)
+
+    def search(self, query: str, within: list = None) -> list:
+        query = query.lower()
+        if not query:
+            if within is None:
+                return list(range(len(self.keys)))
+            return list(within)
+        if within is None:
+            if len(query) < self.gram:
+                within = self.grams.get(query[:1], ())
+                if len(query) == 1:
+                    return list(within)
+            else:
+                postings = list()
+                for start in range(len(query) - self.gram + 1):
+                    posting = self.grams.get(query[start:start + self.gram])
+                    if posting is None:
+                        return []
+                    postings.append(posting)
+                within = min(postings, key=len)
+        return [idx for idx in within if query in self.keys[idx]]
+
+
+class FilterModel:
+
+    def __init__(self, entries: tuple, start_key: int = 47):
+        self.entries = entries
+        self.start_key = start_key
+        self.index = None
+        self.active = False
+        self.query = ''
+        self.view = None
+        self._history = list()
+        self._building = None
+        self._build()
+
+    def _build(self):
+        # Short lists scan faster than they index; long ones index on a
+        # worker thread and scan linearly until the index is ready.
+        if self._building is not None:
+            self._building.cancel()
+            self._building = None
+        if len(self.entries) >= index_threshold:
+            self._building = _executor('thread').submit(
+                SearchIndex, tuple(self.entries))
+
+    def _search(self, query: str, within: list = None) -> list:
+        if self._building is not None and self._building.done():
+            self.index = self._building.result()
+            self._building = None
+        if self.index is not None:
+            return self.index.search(query, within)
+        query = query.lower()
+        if within is None:
+            within = range(len(self.entries))
+        return [idx for idx in within
+                if query in str(self.entries[idx]).lower()]
+
+    def clear(self):
+        self.active = False
+        self.query = ''
+        self.view = None
+        self._history = list()
+
+    def reset(self, entries: tuple):
+        self.entries = entries
+        self.index = None
+        self._build()
+        self._history = list()
+        if self.query:
+            query = self.query.lower()
+            self.view = [idx for idx, entry in enumerate(entries)
+                         if query in str(entry).lower()]
+
+    def _push(self, char: str):
+        self._history.append((self.query, self.view))
+        self.query += char
+        self.view = self._search(self.query, self.view)
+
+    def _pop(self):
+        if self._history:
+            self.query, self.view = self._history.pop()
+
+    def update(self, value: int) -> bool:
+        if not self.active:
+            if value == self.start_key:
+                self.active = True
+                return True
+            if value == 27 and self.query:
+                self.clear()
+                return True
+            return False
+        if value == 13:
+            self.active = False
+        elif value == 27:
+            self.clear()
+        elif value in (8, 127):
+            self._pop()
+        elif isinstance(value, int) and 32 <= value < keys.key_base and \
+                chr(value).isprintable():
+            self._push(chr(value))
+        else:
+            return False
+        return True
+
+    @property
+    def prompt(self) -> str:
+        if self.active or self.query:
+            return '/' + self.query
+        return None
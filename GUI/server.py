@@ -0,0 +1,216 @@
+import functools
+
+from . import keys
+from .dispatch import Dispatcher
+from .render import DisplayModel, Renderer, RenderCache
+
+
+def widget_state(widget: isinstance) -> tuple:
+    counter = getattr(widget, 'counter', None)
+    if counter is None:
+        return (widget.visibility,)
+    busy = getattr(widget, 'busy', 0)
+    filter_mod = widget.filter_mod
+    if filter_mod is None:
+        query = None
+    else:
+        query = (filter_mod.active, filter_mod.query, filter_mod.view,
+                 list(filter_mod._history))
+    return (widget.visibility, counter.data_out, counter.max,
+            counter.click_value, widget.top,
+            getattr(widget, 'data_out', None), query, counter.pending, busy)
+
+
+def restore_widget(widget: isinstance, state: tuple):
+    widget.visibility = state[0]
+    if len(state) == 1:
+        return
+    counter = widget.counter
+    counter.data_out, counter.max, counter.click_value = state[1:4]
+    counter.pending = state[7]
+    widget.top = state[4]
+    if hasattr(widget, 'busy'):
+        widget.busy = state[8]
+    if state[5] is not None:
+        widget.data_out = state[5]
+    if state[6] is not None and widget.filter_mod is not None:
+        filter_mod = widget.filter_mod
+        filter_mod.active, filter_mod.query, filter_mod.view = state[6][:3]
+        filter_mod._history = list(state[6][3])
+    widget._render_key = None
+
+
+class _SocketStream:
+    __slots__ = ('writer',)
+
+    def __init__(self, writer: object):
+        self.writer = writer
+
+    def write(self, data: str):
+        self.writer.write(data.encode('utf-8'))
+
+    def flush(self):
+        pass
+
+
+class MenuSession:
+    __slots__ = ('writer', 'renderer', 'widgets', 'selected_channel',
+                 'single_position', 'data', 'rows', 'groups', 'pending')
+
+    def __init__(self, writer: object, defaults: dict):
+        self.writer = writer
+        self.renderer = Renderer(_SocketStream(writer))
+        self.widgets = dict(defaults['widgets'])
+        self.selected_channel = list(defaults['selected_channel'])
+        self.single_position = dict(defaults['single_position'])
+        self.data = None
+        self.rows = dict()
+        self.groups = None
+        self.pending = b''
+
+    def save(self, dispatcher: Dispatcher, display: DisplayModel):
+        for widget in self.widgets:
+            self.widgets[widget] = widget_state(widget)
+        self.selected_channel = dispatcher.selected_channel
+        self.single_position = dispatcher.single_position
+        self.data = dispatcher.data
+        self.rows = display._rows
+        self.groups = display._groups
+
+    def load(self, dispatcher: Dispatcher, display: DisplayModel):
+        for widget, state in self.widgets.items():
+            restore_widget(widget, state)
+        dispatcher.selected_channel = self.selected_channel
+        dispatcher.single_position = self.single_position
+        dispatcher._transfer_data = self.data
+        display.set_renderer(self.renderer)
+        if self.groups is display._groups:
+            display._rows = self.rows
+        else:
+            display._rows = dict()
+        display._dirty = dict()
+
+
+class MenuServer:
+
+    def __init__(self, dispatcher: Dispatcher,
+                 display: DisplayModel,
+                 cache_size: int = 4096):
+        self.dispatcher = dispatcher
+        self.display = display
+        self.sessions = list()
+        self.active = None
+        self.server = None
+        self.loop = None
+        display.render_cache = RenderCache(cache_size)
+        self.defaults = self._defaults()
+        display.watcher = self
+
+    def _widgets(self) -> dict:
+        widgets = dict.fromkeys(self.display.display_unit)
+        for members in self.dispatcher.observers.values():
+            widgets.update(dict.fromkeys(members))
+        return widgets
+
+    def _defaults(self) -> dict:
+        return {'widgets': {widget: widget_state(widget)
+                            for widget in self._widgets()},
+                'selected_channel': list(self.dispatcher.selected_channel),
+                'single_position': dict(self.dispatcher.single_position)}
+
+    def unit_added(self, widget: isinstance):
+        # A widget built while a client is typing (an opened submenu)
+        # belongs to that client; everyone else starts with it hidden.
+        state = widget_state(widget)
+        hidden = state if self.active is None else (False,) + state[1:]
+        self.defaults['widgets'][widget] = hidden
+        for session in self.sessions:
+            session.widgets[widget] = \
+                state if session is self.active else hidden
+
+    def unit_removed(self, widget: isinstance):
+        self.defaults['widgets'].pop(widget, None)
+        for session in self.sessions:
+            session.widgets.pop(widget, None)
+
+    def _resume(self, session: MenuSession) -> bool:
+        if session not in self.sessions:
+            return False
+        self.activate(session)
+        return True
+
+    def activate(self, session: MenuSession):
+        if self.active is session:
+            return
+        if self.active is not None:
+            self.active.save(self.dispatcher, self.display)
+        session.load(self.dispatcher, self.display)
+        self.active = session
+        self.dispatcher.context = functools.partial(self._resume, session)
+
+    def render(self, session: MenuSession):
+        self.activate(session)
+        self.display.render()
+
+    def refresh(self):
+        self.dispatcher.drain()
+        for session in self.sessions:
+            self.render(session)
+
+    def feed(self, session: MenuSession, data: bytes) -> bool:
+        events, session.pending = keys.decode_keys(session.pending + data)
+        if 3 in events:
+            return False
+        self.activate(session)
+        self.dispatcher.feed(events, render=False)
+        self.dispatcher.drain()
+        self.activate(session)
+        self.display.render()
+        return True
+
+    async def _serve(self, reader: object,
+                     writer: object):
+        session = MenuSession(writer, self.defaults)
+        self.sessions.append(session)
+        try:
+            self.render(session)
+            while True:
+                data = await reader.read(4096)
+                if not data or not self.feed(session, data):
+                    break
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions.remove(session)
+            if self.active is session:
+                self.active = None
+                self.dispatcher.context = None
+            writer.close()
+
+    async def start(self, path: str = None,
+                    host: str = '127.0.0.1',
+                    port: int = 0,
+                    backlog: int = 512):
+        import asyncio
+        self.loop = asyncio.get_running_loop()
+        self.dispatcher.waker = lambda: self.loop.call_soon_threadsafe(
+            self.refresh)
+        if path is not None:
+            self.server = await asyncio.start_unix_server(
+                self._serve, path=path, backlog=backlog)
+        else:
+            self.server = await asyncio.start_server(
+                self._serve, host, port, backlog=backlog)
+        return self.server
+
+    async def run(self, path: str = None,
+                  host: str = '127.0.0.1',
+                  port: int = 0,
+                  backlog: int = 512):
+        server = await self.start(path, host, port, backlog)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.dispatcher.waker = None
@@ -0,0 +1,65 @@
+from .backends import platform
+
+
+class InputSession:
+
+    def __init__(self, fd: int = None, timeout: float = 0.05):
+        self.fd = fd
+        self.timeout = timeout
+        self.queue = list()
+        self._pending = b''
+        self._old_settings = None
+        self._old_handlers = dict()
+        self._wake_pipe = None
+        self._woken = False
+        self.backend = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def fileno(self) -> int:
+        return self.fd
+
+    def open(self):
+        self.backend = platform()
+        self.backend.open_session(self)
+
+    def close(self):
+        if self.backend is not None:
+            self.backend.close_session(self)
+
+    def wake(self):
+        self._woken = True
+        if self.backend is not None:
+            self.backend.wake(self)
+
+    def read(self, block: bool = True, timeout: float = None) -> list:
+        if self.backend is None:
+            self.backend = platform()
+        events = self.queue
+        self.queue = list()
+        events += self.backend.read(self, block and not events, timeout)
+        self._woken = False
+        return events
+
+    def get_key(self):
+        while not self.queue:
+            self.queue = self.read()
+        return self.queue.pop(0)
+
+
+_session = None
+
+
+def press_key() -> int:
+    global _session
+    if _session is None:
+        import atexit
+        _session = InputSession()
+        _session.open()
+        atexit.register(_session.close)
+    return _session.get_key()
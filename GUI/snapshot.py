@@ -0,0 +1,142 @@
+import io
+import os
+import zlib
+import itertools
+
+from .macro import _write_varint, _read_varint
+
+snapshot_magic = b'MNUS'
+snapshot_version = 2
+identity_sample = 8
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value // 2 if not value & 1 else -(value + 1) // 2
+
+
+def _widgets(dispatcher: isinstance) -> list:
+    widgets = dict()
+    for members in dispatcher.observers.values():
+        widgets.update(dict.fromkeys(members))
+    for display in dispatcher._displays():
+        widgets.update(dict.fromkeys(display.display_unit))
+    return list(widgets)
+
+
+def _identities(widgets: list) -> dict:
+    # Keyed by content rather than position, so widgets built lazily in
+    # one process still line up with the same widgets in another.
+    identities = dict()
+    seen = dict()
+    for widget in widgets:
+        entries = getattr(widget, 'option', None)
+        if entries is None:
+            entries = getattr(widget, 'item', None)
+        if entries is None:
+            text = str(getattr(widget, 'text', getattr(widget, 'title', '')))
+        else:
+            text = '\0'.join(str(entry) for entry in
+                             itertools.islice(entries, identity_sample))
+        text = type(widget).__name__ + '\0' + text
+        occurrence = seen.get(text, 0)
+        seen[text] = occurrence + 1
+        identities[zlib.crc32(text.encode('utf8'), occurrence)] = widget
+    return identities
+
+
+def dump_snapshot(dispatcher: isinstance) -> bytes:
+    identities = _identities(_widgets(dispatcher))
+    stream = io.BytesIO()
+    stream.write(snapshot_magic + bytes((snapshot_version,)))
+    _write_varint(stream, len(identities))
+    for identity, widget in identities.items():
+        _write_varint(stream, identity)
+        counter = getattr(widget, 'counter', None)
+        if counter is None:
+            stream.write(bytes((widget.visibility,)))
+            continue
+        stream.write(bytes((widget.visibility | 2,)))
+        _write_varint(stream, counter.data_out)
+        _write_varint(stream, widget.top)
+    _write_varint(stream, len(dispatcher.selected_channel))
+    for channel in dispatcher.selected_channel:
+        _write_varint(stream, _zigzag(channel))
+    _write_varint(stream, len(dispatcher.single_position))
+    for channel, position in dispatcher.single_position.items():
+        _write_varint(stream, _zigzag(channel))
+        _write_varint(stream, position)
+    return stream.getvalue()
+
+
+def _parse(data: bytes) -> tuple:
+    stream = io.BytesIO(data)
+    header = stream.read(len(snapshot_magic) + 1)
+    if header[:-1] != snapshot_magic:
+        raise ValueError('not a menu snapshot')
+    if header[-1] != snapshot_version:
+        raise ValueError('unsupported snapshot version {version}'.format(
+            version=header[-1]))
+    states = list()
+    for _ in range(_read_varint(stream)):
+        identity = _read_varint(stream)
+        flags = stream.read(1)
+        if not flags:
+            raise EOFError
+        if flags[0] & 2:
+            states.append((identity, bool(flags[0] & 1),
+                           _read_varint(stream), _read_varint(stream)))
+        else:
+            states.append((identity, bool(flags[0] & 1), None, None))
+    selected = [_unzigzag(_read_varint(stream))
+                for _ in range(_read_varint(stream))]
+    single = dict()
+    for _ in range(_read_varint(stream)):
+        channel = _unzigzag(_read_varint(stream))
+        single[channel] = _read_varint(stream)
+    return states, selected, single
+
+
+def restore_snapshot(dispatcher: isinstance, data: bytes):
+    try:
+        states, selected, single = _parse(data)
+    except EOFError:
+        raise ValueError('truncated snapshot') from None
+    identities = _identities(_widgets(dispatcher))
+    for identity, visibility, data_out, top in states:
+        widget = identities.get(identity)
+        if widget is None:
+            continue
+        widget.visibility = visibility
+        counter = getattr(widget, 'counter', None)
+        if data_out is not None and counter is not None:
+            counter.data_out = min(data_out, max(counter.max - 1, 0))
+            widget.top = top
+    dispatcher.selected_channel = selected
+    for channel, position in single.items():
+        members = dispatcher.observers.get(channel)
+        if members:
+            dispatcher.single_position[channel] = min(position,
+                                                      len(members) - 1)
+    for display in dispatcher._displays():
+        display.regions = None
+
+
+def save_snapshot(dispatcher: isinstance, path: str):
+    temporary = path + '.tmp'
+    with open(temporary, 'wb') as file:
+        file.write(dump_snapshot(dispatcher))
+    os.replace(temporary, path)
+
+
+def load_snapshot(dispatcher: isinstance, path: str) -> bool:
+    try:
+        with open(path, 'rb') as file:
+            data = file.read()
+    except FileNotFoundError:
+        return False
+    restore_snapshot(dispatcher, data)
+    return True
@@ -0,0 +1,260 @@
+import functools
+
+from .common import space
+
+
+fColor = {'black': '30', 'red': '31',
+          'green': '32', 'yellow': '33',
+          'blue': '34', 'magenta': '35',
+          'cyan': '36', 'white': '37'
+          }
+bgColor = {'black': '40', 'red': '41',
+           'green': '42', 'yellow': '43',
+           'blue': '44', 'magenta': '45',
+           'cyan': '46', 'white': '47'
+           }
+_decor = {'default': '00', 'highlight': '01',
+          'url': '04', 'reverse': '07'}
+reset_code = '\033[00m'
+
+
+class Style:
+    __slots__ = ('codes', 'prefix')
+
+    def __init__(self, codes: tuple = ()):
+        codes = tuple(dict.fromkeys(codes))
+        object.__setattr__(self, 'codes', codes)
+        if codes:
+            object.__setattr__(self, 'prefix',
+                               '\033[' + ';'.join(codes) + 'm')
+        else:
+            object.__setattr__(self, 'prefix', '')
+
+    def __setattr__(self, key, value):
+        raise AttributeError('Style is immutable')
+
+    def __eq__(self, other):
+        return isinstance(other, Style) and self.codes == other.codes
+
+    def __hash__(self):
+        return hash(self.codes)
+
+    def __repr__(self):
+        return 'Style({codes!r})'.format(codes=self.codes)
+
+    def __add__(self, other):
+        return compose_style(self, other)
+
+    def paint(self, text: str) -> str:
+        if self.prefix:
+            return self.prefix + text + reset_code
+        return text
+
+
+@functools.lru_cache(maxsize=None)
+def compile_style(color: str = None, background: str = None,
+                  highlight: bool = False, underline: bool = False,
+                  reverse: bool = False, decor: str = None) -> Style:
+    codes = list()
+    if reverse:
+        codes.append(_decor['reverse'])
+    if highlight:
+        codes.append(_decor['highlight'])
+    if underline:
+        codes.append(_decor['url'])
+    if decor in _decor.keys():
+        codes.append(_decor[decor])
+    if color in fColor.keys():
+        codes.append(fColor[color])
+    if background in bgColor.keys():
+        codes.append(bgColor[background])
+    return Style(tuple(codes))
+
+
+@functools.lru_cache(maxsize=None)
+def compose_style(first: Style, second: Style) -> Style:
+    if not second.codes:
+        return first
+    if not first.codes:
+        return second
+    return Style(first.codes + second.codes)
+
+
+plain = compile_style()
+
+
+class Segment(tuple):
+    __slots__ = ()
+
+    def __new__(cls, text: str, style: Style = plain):
+        return tuple.__new__(cls, (text, style))
+
+    @property
+    def text(self) -> str:
+        return self[0]
+
+    @property
+    def style(self) -> Style:
+        return self[1]
+
+    def paint(self) -> str:
+        return self.style.paint(self.text)
+
+
+@functools.lru_cache(maxsize=None)
+def _char_width(char: str) -> int:
+    import unicodedata
+    if unicodedata.combining(char) or \
+            unicodedata.category(char) in ('Mn', 'Me', 'Cf', 'Cc'):
+        return 0
+    if unicodedata.east_asian_width(char) in ('W', 'F'):
+        return 2
+    return 1
+
+
+@functools.lru_cache(maxsize=4096)
+def _text_width(text: str) -> int:
+    return sum(_char_width(char) for char in text)
+
+
+def cell_width(text: str) -> int:
+    if text.isascii():
+        return len(text)
+    return _text_width(text)
+
+
+@functools.lru_cache(maxsize=None)
+def _sgr_pattern():
+    import re
+    return re.compile('\033\\[[0-9;]*m')
+
+
+def painted_width(line: str) -> int:
+    if '\033' in line:
+        line = _sgr_pattern().sub('', line)
+    return cell_width(line)
+
+
+def wrap_cells(text: str, width: int) -> list:
+    lines = list()
+    start = 0
+    used = 0
+    for index, char in enumerate(text):
+        size = _char_width(char)
+        if used + size > width and index > start:
+            lines.append(text[start:index])
+            start = index
+            used = 0
+        used += size
+    lines.append(text[start:])
+    return lines
+
+
+def pad_cells(text: str, width: int, align: str = 'left',
+              fill: str = space) -> str:
+    width += len(text) - cell_width(text)
+    if align == 'right':
+        return text.rjust(width, fill)
+    elif align == 'center':
+        return text.center(width, fill)
+    return text.ljust(width, fill)
+
+
+class StyleModel:
+    fColor = fColor
+    bgColor = bgColor
+    _decor = _decor
+    __slots__ = ('color', 'background', 'decor', 'width', 'align',
+                 'right_margin', 'left_margin', 'margin', 'version',
+                 'style')
+
+    def __init__(self,
+                 color=None,
+                 background=None,
+                 decor=None,
+                 width=None,
+                 align='left',
+                 r_margin=0,
+                 l_margin=0,
+                 margin=0):
+        self.color = color
+        self.background = background
+        self.decor = decor
+        self.width = width
+        self.align = align
+        self.right_margin = r_margin
+        self.left_margin = l_margin
+        self.margin = margin
+        self.version = 0
+        self.style = compile_style(color, background, decor=decor)
+
+    def segment(self, value, color: str = None,
+                background: str = None, highlight: bool = False,
+                underline: bool = False, reverse: bool = False) -> Segment:
+        style = compile_style(color, background, highlight,
+                              underline, reverse)
+        if isinstance(value, Segment):
+            return Segment(value.text, value.style + style)
+        return Segment(value, style)
+
+    def rending(self, value, color: str = None,
+                background: str = None, highlight: bool = False,
+                underline: bool = False, reverse: bool = False) -> str:
+        return self.segment(value, color, background, highlight,
+                            underline, reverse).paint()
+
+    def set_up(self,
+               color=None,
+               background=None,
+               decor=None,
+               width=None,
+               align='left',
+               r_margin=0,
+               l_margin=0,
+               margin=0):
+        self.color = color
+        self.background = background
+        self.decor = decor
+        self.width = width
+        self.align = align
+        self.right_margin = r_margin
+        self.left_margin = l_margin
+        self.margin = margin
+        self.style = compile_style(color, background, decor=decor)
+        self.version += 1
+
+    def _wrap(self, value: str, width: int) -> list:
+        modified_str = list()
+        if not value.isascii():
+            lines = wrap_cells(value, width)
+            value = lines.pop()
+            modified_str.extend(pad_cells(line, width) for line in lines)
+        elif width < len(value):
+            line_num = len(value) // width + 1
+            for n in range(1, line_num):
+                start = (n - 1) * width
+                end = n * width
+                modified_str.append(value[start: end])
+            last_start = len(value) // width * width
+            value = value[last_start:]
+        if self.align in ('left', 'right', 'center'):
+            modified_str.append(pad_cells(value, width, self.align))
+        return modified_str
+
+    def brace(self, value) -> tuple:
+        new_strings = list()
+        if not isinstance(value, Segment):
+            value = Segment(value)
+        style = value.style + self.style
+        if self.width is not None:
+            for line in self._wrap(value.text, self.width):
+                new_line = style.paint(line)
+                if self.left_margin or self.right_margin:
+                    new_line = self.left_margin * space + new_line + \
+                               self.right_margin * space
+                else:
+                    new_line = self.margin * space + new_line + \
+                               self.margin * space
+
+                new_strings.append(new_line)
+        return tuple(new_strings)
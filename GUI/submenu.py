@@ -0,0 +1,115 @@
+import collections
+
+from .dispatch import Dispatcher
+from .render import DisplayModel
+
+
+class SubmenuCache:
+
+    def __init__(self, limit: int = 8):
+        self.limit = limit
+        self.built = collections.OrderedDict()
+        self._trimming = False
+
+    def touch(self, submenu: isinstance):
+        self.built[submenu] = None
+        self.built.move_to_end(submenu)
+        if len(self.built) > self.limit and not self._trimming:
+            # The widget whose click opened this submenu may still be
+            # inside its update(), so evict once the key is handled.
+            self._trimming = True
+            submenu.dispatcher.post(self.trim)
+
+    def trim(self):
+        self._trimming = False
+        for submenu in list(self.built):
+            if len(self.built) <= self.limit:
+                break
+            if not submenu.opened:
+                del self.built[submenu]
+                submenu.evict()
+
+    def discard(self, submenu: isinstance):
+        self.built.pop(submenu, None)
+
+
+class Submenu:
+
+    def __init__(self, factory: object,
+                 dispatcher: Dispatcher,
+                 display: DisplayModel,
+                 channel: int = 0,
+                 cache: SubmenuCache = None):
+        self.factory = factory
+        self.dispatcher = dispatcher
+        self.display = display
+        self.channel = channel
+        self.cache = cache
+        self.widgets = None
+        self.opened = False
+        self._return_to = None
+
+    @property
+    def built(self) -> bool:
+        return self.widgets is not None
+
+    def build(self):
+        widgets = self.factory(self)
+        if not isinstance(widgets, (list, tuple)):
+            widgets = (widgets,)
+        self.widgets = tuple(widgets)
+        for widget in self.widgets:
+            widget.set_display_unit(self.display)
+            if hasattr(widget, 'control_mod'):
+                self.dispatcher.add(widget, channel=self.channel)
+
+    def _focus(self, observer: isinstance):
+        members = self.dispatcher.observers.get(self.channel, [])
+        if observer in members:
+            self.dispatcher.single_position[self.channel] = \
+                members.index(observer)
+
+    def open(self):
+        if self.widgets is None:
+            self.build()
+        else:
+            for widget in self.widgets:
+                widget.show()
+        self.opened = True
+        if self.cache is not None:
+            self.cache.touch(self)
+        if self.dispatcher.single_mode.get(self.channel, False):
+            members = self.dispatcher.observers[self.channel]
+            self._return_to = members[
+                self.dispatcher.single_position[self.channel]]
+            for widget in self.widgets:
+                if widget in members:
+                    self._focus(widget)
+                    break
+        self.display.update()
+
+    def close(self):
+        self.opened = False
+        if self.widgets is not None:
+            for widget in self.widgets:
+                widget.hide()
+            if self._return_to is not None:
+                self._focus(self._return_to)
+                self._return_to = None
+            self.display.update()
+
+    def evict(self):
+        if self.widgets is None:
+            return
+        for widget in self.widgets:
+            if hasattr(widget, 'control_mod'):
+                self.dispatcher.remove(widget, channel=self.channel)
+            self.display.remove(widget)
+            widget.display_mod = None
+        self.widgets = None
+        self.opened = False
+        if self.cache is not None:
+            self.cache.discard(self)
+
+    def __call__(self, arg: tuple = None):
+        self.open()
@@ -0,0 +1,123 @@
+_background_tasks = set()
+
+
+def run_coroutine(coroutine):
+    import asyncio
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run_coroutine_threadsafe(coroutine, _executor('async'))
+    task = loop.create_task(coroutine)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+_executors = dict()
+
+
+def _executor(mode: str):
+    if mode not in _executors:
+        if mode == 'process':
+            from concurrent.futures import ProcessPoolExecutor
+            _executors[mode] = ProcessPoolExecutor()
+        elif mode == 'async':
+            import asyncio
+            import threading
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='menu-async',
+                             daemon=True).start()
+            _executors[mode] = loop
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+            _executors[mode] = ThreadPoolExecutor(thread_name_prefix='menu')
+    return _executors[mode]
+
+
+def _run_by_name(module: str, qualname: str, *args):
+    import importlib
+    func = importlib.import_module(module)
+    for name in qualname.split('.'):
+        func = getattr(func, name)
+    if isinstance(func, BackgroundJob):
+        func = func.func
+    return func(*args)
+
+
+class BackgroundJob:
+
+    def __init__(self, func: object, mode: str = 'thread',
+                 done: object = None, error: object = None):
+        if mode not in ('thread', 'process', 'async'):
+            raise ValueError('unknown background mode {mode!r}'.format(
+                mode=mode))
+        self.func = func
+        self.mode = mode
+        self.done = done
+        self.error = error
+        self.__qualname__ = getattr(func, '__qualname__', None) or repr(func)
+
+    def __call__(self, *args):
+        return self.func(*args)
+
+    def submit(self, widget: isinstance, arg: tuple = None,
+               dispatcher: isinstance = None):
+        args = () if arg is None else (arg,)
+        if dispatcher is None:
+            self._finish(widget, self.func(*args), None)
+            return
+        if hasattr(widget, 'busy'):
+            widget.busy += 1
+            widget.invalidate()
+        dispatcher.jobs += 1
+        context = dispatcher.context
+        if self.mode == 'async':
+            future = run_coroutine(self.func(*args))
+        elif self.mode == 'process':
+            future = _executor(self.mode).submit(
+                *self._by_name(), *args)
+        else:
+            future = _executor(self.mode).submit(self.func, *args)
+        future.add_done_callback(
+            lambda done: dispatcher.post(self._complete, widget, dispatcher,
+                                         done, context))
+
+    def _by_name(self) -> tuple:
+        # Decorating rebinds the module attribute to this job, which
+        # pickle rejects, so process workers look the function up instead.
+        module = getattr(self.func, '__module__', None)
+        qualname = getattr(self.func, '__qualname__', '')
+        if module is None or '<locals>' in qualname:
+            return (self.func,)
+        return (_run_by_name, module, qualname)
+
+    def _complete(self, widget: isinstance, dispatcher: isinstance,
+                  future: object, context: object = None):
+        dispatcher.jobs -= 1
+        resumed = context is None or context()
+        if resumed and hasattr(widget, 'busy'):
+            widget.busy -= 1
+            widget.invalidate()
+        if future.cancelled():
+            return
+        exception = future.exception()
+        result = None if exception is not None else future.result()
+        self._finish(widget, result, exception)
+        if getattr(widget, 'display_mod', None) is not None:
+            widget.display_mod.update()
+
+    def _finish(self, widget: isinstance, result: object,
+                exception: BaseException):
+        if exception is not None:
+            if self.error is None:
+                raise exception
+            self.error(exception)
+        elif self.done is not None:
+            self.done(result)
+
+
+def background(func: object = None, mode: str = 'thread',
+               done: object = None, error: object = None):
+    if func is None:
+        return lambda target: BackgroundJob(target, mode, done, error)
+    return BackgroundJob(func, mode, done, error)
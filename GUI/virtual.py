@@ -0,0 +1,98 @@
+import functools
+
+from .common import space
+from .style import _char_width
+
+
+@functools.lru_cache(maxsize=None)
+def control_pattern():
+    import re
+    return re.compile('\033\\[([0-9;?]*)([@-~])|\n|\r')
+
+
+class VirtualScreen:
+
+    def __init__(self, width: int = 80, height: int = 24):
+        self.width = width
+        self.height = height
+        self.row = 0
+        self.column = 0
+        self.sgr = ''
+        self.cursor_visible = True
+        self.writes = 0
+        self.bytes_written = 0
+        self.cells = [[(space, '')] * width for _ in range(height)]
+
+    def _put(self, text: str):
+        if not text.isascii():
+            cells = list()
+            for char in text:
+                size = _char_width(char)
+                if not size and cells:
+                    cells[-1] = (cells[-1][0] + char, self.sgr)
+                elif size:
+                    cells.append((char, self.sgr))
+                    cells.extend([('', self.sgr)] * (size - 1))
+        else:
+            cells = [(char, self.sgr) for char in text]
+        if self.row < self.height and self.column < self.width:
+            end = min(self.column + len(cells), self.width)
+            self.cells[self.row][self.column:end] = cells[:end - self.column]
+        self.column += len(cells)
+
+    def _erase_line(self, row: int, column: int = 0):
+        if row < self.height:
+            line = self.cells[row]
+            line[column:] = [(space, '')] * (self.width - column)
+
+    def _control(self, params: str, final: str):
+        if final == 'm':
+            self.sgr = '' if params in ('', '0', '00') else params
+        elif final == 'H':
+            row, _, column = params.partition(';')
+            self.row = int(row or 1) - 1
+            self.column = int(column or 1) - 1
+        elif final == 'K':
+            self._erase_line(self.row, self.column)
+        elif final == 'J':
+            if params == '2':
+                for row in range(self.height):
+                    self._erase_line(row)
+            else:
+                self._erase_line(self.row, self.column)
+                for row in range(self.row + 1, self.height):
+                    self._erase_line(row)
+        elif final == 'l' and params == '?25':
+            self.cursor_visible = False
+        elif final == 'h' and params == '?25':
+            self.cursor_visible = True
+
+    def write(self, data: str):
+        self.writes += 1
+        self.bytes_written += len(data)
+        index = 0
+        for match in control_pattern().finditer(data):
+            if match.start() > index:
+                self._put(data[index:match.start()])
+            index = match.end()
+            if match.group(2):
+                self._control(match.group(1), match.group(2))
+            elif match.group() == '\n':
+                self.row += 1
+                self.column = 0
+            else:
+                self.column = 0
+        if index < len(data):
+            self._put(data[index:])
+
+    def flush(self):
+        pass
+
+    def line(self, row: int) -> str:
+        return ''.join(char for char, _ in self.cells[row]).rstrip()
+
+    def text(self) -> str:
+        return '\n'.join(self.line(row) for row in range(self.height))
+
+    def style_at(self, row: int, column: int) -> str:
+        return self.cells[row][column][1]
@@ -0,0 +1,327 @@
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+import tracemalloc
+
+from GUI import *
+
+root = os.path.dirname(os.path.abspath(__file__))
+baseline_path = os.path.join(root, 'benchmark_baseline.json')
+startup_script = '''
+import sys
+import time
+start = time.perf_counter()
+from GUI import *
+imported = time.perf_counter()
+sys.path.insert(0, {root!r})
+import benchmark
+resume = time.perf_counter()
+publish, screen = benchmark.build_screen({scale})
+screen.init_scene()
+print(imported - start + time.perf_counter() - resume)
+'''
+
+
+def widget_factory(kind: str, n: int):
+    if kind == 'option':
+        return Option(('one', 'two', 'three'), color='green')
+    elif kind == 'item':
+        return Item((1, 2, 3), color='green')
+    elif kind == 'label':
+        return Label('label {n}'.format(n=n), color='green')
+    elif kind == 'caption':
+        return Caption(title='caption', bookmark='index')
+
+
+def memory(count: int = 5000) -> dict:
+    result = dict()
+    for kind in ('option', 'item', 'label', 'caption'):
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        widgets = [widget_factory(kind, n) for n in range(count)]
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        size = sum(stat.size_diff for stat in
+                   after.compare_to(before, 'filename'))
+        result[kind] = size / len(widgets)
+    return result
+
+
+def build_screen(scale: int = 1, backend=None) -> tuple:
+    publish = Dispatcher()
+    screen = DisplayModel(backend=backend or VirtualScreen(80, 60 * scale))
+    caption = Caption(title='Menu', bookmark='index')
+    caption.set_display_unit(screen)
+    for n in range(scale):
+        t_label = Label('group {n}:'.format(n=n), color='green')
+        t_option = Option(tuple('option {m}'.format(m=m)
+                                for m in range(3 * scale)),
+                          color='green',
+                          background='red',
+                          layout='division',
+                          margin=4,
+                          width=12)
+        r_option = Option(('1.', '2.'),
+                          color='red',
+                          layout='division',
+                          arrange='row',
+                          width=8,
+                          align='right',
+                          margin=2)
+        t_label.set_display_unit(screen)
+        t_option.set_func(index=0, func=nope)
+        t_option.set_func(index=1, func='next')
+        t_option.set_func(index=1, func=r_option.show)
+        t_option.set_display_unit(screen)
+        r_option.set_func(index=0, func='next')
+        r_option.set_func(index=0, func=r_option.hide)
+        r_option.set_func(index=1, func=nope)
+        r_option.hide()
+        r_option.set_display_unit(screen)
+        k_item = Item(tuple(range(10 * scale)), color='green')
+        k_item.set_display_unit(screen)
+        k_item.set_func(index=97, func='back')
+        k_item.set_func(index=97, func=r_option.show)
+        k_item.set_func(index=100, func='next')
+        publish.add(t_option, channel=1)
+        publish.add(r_option, channel=1)
+        publish.add(k_item, channel=1)
+    publish.select_channel(channel=0)
+    publish.select_channel(channel=1)
+    publish.set_single_channel(channel=1)
+    return publish, screen
+
+
+def key_script(length: int) -> list:
+    pattern = (100, 100, 115, 119, 100, 13, 100, 13, 119, 115, 97, 101)
+    return [pattern[n % len(pattern)] for n in range(length)]
+
+
+def percentile(samples: list, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+class Probe:
+
+    def __init__(self, targets: tuple):
+        self.targets = targets
+        self.originals = list()
+        self.stats = dict()
+        self._stack = list()
+
+    def _wrap(self, name: str, func: object):
+        stats = self.stats.setdefault(name, {'calls': 0, 'bytes': 0})
+        stack = self._stack
+
+        def wrapper(*args, **kwargs):
+            start, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+            stack.append([start, 0])
+            tracemalloc.reset_peak()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                peak = tracemalloc.get_traced_memory()[1]
+                start, running = stack.pop()
+                peak = max(running, peak)
+                if stack:
+                    stack[-1][1] = max(stack[-1][1], peak)
+                stats['calls'] += 1
+                stats['bytes'] += peak - start
+        return wrapper
+
+    def __enter__(self):
+        for owner, name in self.targets:
+            func = owner.__dict__[name]
+            self.originals.append((owner, name, func))
+            setattr(owner, name, self._wrap(owner.__name__ + '.' + name,
+                                            func))
+        tracemalloc.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        tracemalloc.stop()
+        for owner, name, func in self.originals:
+            setattr(owner, name, func)
+
+
+def latency(scale: int = 1, length: int = 2000) -> dict:
+    publish, screen = build_screen(scale)
+    screen.init_scene()
+    samples = list()
+    for key in key_script(length):
+        start = time.perf_counter()
+        publish.data = key
+        samples.append((time.perf_counter() - start) * 1e6)
+    result = {'p50': percentile(samples, 0.5),
+              'p90': percentile(samples, 0.9),
+              'p99': percentile(samples, 0.99),
+              'max': max(samples)}
+    publish, screen = build_screen(scale)
+    targets = ((DisplayModel, 'render'),
+               (DisplayModel, '_assemble'),
+               (StyleModel, 'rending'),
+               (StyleModel, 'brace'))
+    with Probe(targets) as probe:
+        screen.init_scene()
+        for key in key_script(length):
+            publish.data = key
+    for name, stats in probe.stats.items():
+        calls = stats['calls']
+        result[name] = {'calls': calls,
+                        'bytes/call': stats['bytes'] / calls if calls else 0}
+    return result
+
+
+def startup(scale: int = 1, runs: int = 7) -> dict:
+    environment = dict(os.environ)
+    environment.pop('PYTHONDONTWRITEBYTECODE', None)
+    command = [sys.executable, '-c',
+               startup_script.format(root=root, scale=scale)]
+    samples = list()
+    for run in range(runs + 1):
+        output = subprocess.run(command, cwd=root, env=environment,
+                                capture_output=True, text=True, check=True)
+        if run:
+            samples.append(float(output.stdout) * 1e3)
+    return {'p50': percentile(samples, 0.5),
+            'min': min(samples),
+            'max': max(samples)}
+
+
+def hot_path(scale: int = 1, length: int = 2000) -> dict:
+    publish, screen = build_screen(scale)
+    stats.reset()
+    stats.enable()
+    try:
+        screen.init_scene()
+        for key in key_script(length):
+            publish.data = key
+    finally:
+        stats.disable()
+    return stats.report()
+
+
+def compare(result: dict, baseline: dict, tolerance: float) -> list:
+    regressions = list()
+    for name in ('p50', 'p90'):
+        limit = baseline[name] * (1 + tolerance)
+        if result[name] > limit:
+            regressions.append('{name}: {value:.1f}us > {limit:.1f}us'.format(
+                name=name, value=result[name], limit=limit))
+    for name, stats in result.items():
+        if not isinstance(stats, dict) or name not in baseline:
+            continue
+        limit = baseline[name]['bytes/call'] * (1 + tolerance)
+        if stats['bytes/call'] > limit:
+            regressions.append('{name}: {value:.0f}B > {limit:.0f}B'.format(
+                name=name, value=stats['bytes/call'], limit=limit))
+    return regressions
+
+
+def report(result: dict):
+    for name in ('p50', 'p90', 'p99', 'max'):
+        print('{name:<24}{value:>12.1f} us'.format(name=name,
+                                                   value=result[name]))
+    for name, stats in result.items():
+        if isinstance(stats, dict):
+            print('{name:<24}{calls:>12} calls{size:>12.0f} B/call'.format(
+                name=name, calls=stats['calls'], size=stats['bytes/call']))
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('command', nargs='?', default='latency',
+                        choices=('memory', 'latency', 'replay', 'stats',
+                                 'startup'))
+    parser.add_argument('--macro', default='macro.bin')
+    parser.add_argument('--scale', type=int, nargs='+', default=[1, 10])
+    parser.add_argument('--keys', type=int, default=2000)
+    parser.add_argument('--save', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=0.5)
+    args = parser.parse_args(argv[1:])
+    if args.command == 'memory':
+        for kind, size in memory().items():
+            print('{kind:<10}{size:>10.0f} bytes/widget'.format(kind=kind,
+                                                                 size=size))
+        return 0
+    if args.command == 'startup':
+        baseline = dict()
+        if os.path.exists(baseline_path):
+            with open(baseline_path) as file:
+                baseline = json.load(file)
+        failed = False
+        for scale in args.scale:
+            result = startup(scale)
+            print('scale {scale}: import to first frame {p50:.1f} ms '
+                  '(min {min:.1f}, max {max:.1f})'.format(scale=scale,
+                                                          **result))
+            key = 'startup/{scale}'.format(scale=scale)
+            if args.save:
+                baseline[key] = result
+            elif key in baseline:
+                limit = baseline[key]['p50'] * (1 + args.tolerance)
+                if result['p50'] > limit:
+                    print('REGRESSION startup: {value:.1f}ms > '
+                          '{limit:.1f}ms'.format(value=result['p50'],
+                                                 limit=limit))
+                    failed = True
+        if args.save:
+            with open(baseline_path, 'w') as file:
+                json.dump(baseline, file, indent=2, sort_keys=True)
+        return 1 if failed else 0
+    if args.command == 'stats':
+        for scale in args.scale:
+            print('scale {scale}'.format(scale=scale))
+            for name, summary in sorted(hot_path(scale, args.keys).items()):
+                print('{name:<28}{count:>8} calls{p50:>10.1f} us p50'
+                      '{p99:>10.1f} us p99'.format(name=name,
+                                                   count=summary['count'],
+                                                   p50=summary['p50_us'],
+                                                   p99=summary['p99_us']))
+        return 0
+    if args.command == 'replay':
+        for scale in args.scale:
+            publish, screen = build_screen(scale)
+            screen.init_scene()
+            result = publish.replay(args.macro, headless=True)
+            samples = [n * 1e6 for n in result['latency']]
+            print('scale {scale}: {keys} keys'.format(scale=scale,
+                                                       keys=result['keys']))
+            report({'p50': percentile(samples, 0.5),
+                    'p90': percentile(samples, 0.9),
+                    'p99': percentile(samples, 0.99),
+                    'max': max(samples)})
+            if result['callbacks'] != result['expected']:
+                print('REGRESSION callbacks differ from the recording')
+                return 1
+        return 0
+    baseline = dict()
+    if os.path.exists(baseline_path):
+        with open(baseline_path) as file:
+            baseline = json.load(file)
+    failed = False
+    for scale in args.scale:
+        print('scale {scale}'.format(scale=scale))
+        result = latency(scale, args.keys)
+        report(result)
+        key = 'latency/{scale}'.format(scale=scale)
+        if args.save:
+            baseline[key] = result
+        elif key in baseline:
+            for line in compare(result, baseline[key], args.tolerance):
+                print('REGRESSION ' + line)
+                failed = True
+    if args.save:
+        with open(baseline_path, 'w') as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
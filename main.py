@@ -41,6 +41,14 @@ publish.select_channel(channel=0)
 publish.select_channel(channel=1)
 publish.set_single_channel(channel=1)
 
+scheduler = RenderScheduler(max_fps=60)
+screen.scheduler = scheduler
 screen.init_scene()
-while True:
-    publish.data = press_key()
+with InputSession() as session:
+    publish.waker = session.wake
+    while True:
+        timeout = scheduler.due() if scheduler.pending else None
+        for key in session.read(timeout=timeout):
+            publish.data = key
+        publish.drain()
+        scheduler.flush()